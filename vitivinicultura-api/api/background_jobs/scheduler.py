@@ -0,0 +1,223 @@
+"""
+Adaptive scheduler of the category syncs.
+
+Each category is synced on its own schedule instead of every category every
+10 minutes. A category starts at its base interval (SYNC_INTERVAL, or its
+entry in SYNC_CATEGORY_INTERVALS) and adapts it to how often its data
+actually changes upstream:
+
+- a sync that publishes a new version divides the interval by
+  SYNC_BACKOFF_FACTOR, down to SYNC_MIN_INTERVAL;
+- a sync whose table is identical to the published one multiplies it by
+  SYNC_BACKOFF_FACTOR, up to SYNC_MAX_INTERVAL;
+- a failed sync is retried after at most the base interval, resuming from
+  its checkpoint.
+
+A sync is full once the last full sync of its table, recorded with its
+snapshots, is older than SYNC_FULL_INTERVAL, so restarting the process
+does not postpone it.
+
+Every delay is jittered by SYNC_JITTER, so categories drift apart rather
+than syncing in lockstep. Categories that fall due together are synced
+concurrently.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from api.core.config import settings
+from api.services import category_service
+from api.services.scrapers.incremental import full_sync_due
+
+
+class CategorySchedule:
+    """
+    Sync schedule of one category.
+
+    Attributes:
+        category (str): Name of the category.
+        base_interval (float): Configured interval, in seconds.
+        interval (float): Current, adapted interval, in seconds.
+        next_run (float): Monotonic time the next sync is due.
+        last_status (Optional[str]): Status of the last sync.
+        last_run_at (Optional[datetime]): When the last sync finished.
+        last_duration (Optional[float]): Duration of the last sync, in
+            seconds.
+        unchanged_streak (int): Consecutive syncs that changed nothing.
+        runs (int): Syncs run since the process started.
+    """
+
+    def __init__(self, category: str, base_interval: float, now: float):
+        self.category = category
+        self.base_interval = base_interval
+        self.interval = base_interval
+        self.next_run = now
+        self.last_status: Optional[str] = None
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.unchanged_streak = 0
+        self.runs = 0
+
+
+class SyncScheduler:
+    """
+    Runs the category syncs as they fall due and adapts their intervals.
+
+    Attributes:
+        schedules (Dict[str, CategorySchedule]): Schedule of each category.
+        running (bool): Whether the scheduling loop is running.
+    """
+
+    def __init__(self, categories: Optional[List[str]] = None):
+        now = time.monotonic()
+        if categories is None:
+            categories = category_service.get_categories_list()
+        self.schedules = {
+            category: CategorySchedule(
+                category,
+                settings.SYNC_CATEGORY_INTERVALS.get(
+                    category, settings.SYNC_INTERVAL
+                ),
+                now,
+            )
+            for category in categories
+        }
+        self.running = False
+
+    async def run(self):
+        """
+        Syncs the categories forever, sleeping until the next one is due.
+        """
+        self.running = True
+        try:
+            while True:
+                await self.run_due()
+                delay = self.seconds_until_next()
+                print(f"[SYNC] Next sync in {delay:.0f}s.")
+                await asyncio.sleep(delay)
+        finally:
+            self.running = False
+
+    async def run_due(self) -> Dict[str, str]:
+        """
+        Syncs every category that is due, concurrently, and reschedules it.
+
+        The categories share the upstream request budget of the scrapers
+        (SCRAPER_MAX_IN_FLIGHT requests in flight, spaced per host), so
+        running them together does not add load on Embrapa. Each category
+        succeeds or fails on its own.
+
+        Returns:
+            Dict[str, str]: Status of the sync of each category run:
+                "completed", "unchanged" or "failed".
+        """
+        now = time.monotonic()
+        due = [s for s in self.schedules.values() if s.next_run <= now]
+        if not due:
+            return {}
+
+        statuses = await asyncio.gather(
+            *(self._sync(schedule) for schedule in due)
+        )
+        for schedule, status in zip(due, statuses):
+            self._reschedule(schedule, status)
+        changed = sum(status == "completed" for status in statuses)
+        print(
+            f"[SYNC] Synced {len(due)} categories: {changed} changed, "
+            f"{statuses.count('failed')} failed."
+        )
+        return {s.category: status for s, status in zip(due, statuses)}
+
+    def seconds_until_next(self) -> float:
+        """
+        Returns the delay until the next category is due.
+
+        Returns:
+            float: Seconds, 0 if a category is already due.
+        """
+        next_run = min(s.next_run for s in self.schedules.values())
+        return max(next_run - time.monotonic(), 0.0)
+
+    def describe(self) -> List[dict]:
+        """
+        Returns the current schedule of every category.
+
+        Returns:
+            List[dict]: One entry per category, with its intervals, the
+                outcome of its last sync and when the next one is due.
+        """
+        now, wall = time.monotonic(), datetime.now(timezone.utc)
+        return [
+            {
+                "category": s.category,
+                "base_interval": s.base_interval,
+                "interval": s.interval,
+                "next_run_at": wall + timedelta(seconds=s.next_run - now),
+                "last_run_at": s.last_run_at,
+                "last_status": s.last_status,
+                "last_duration": s.last_duration,
+                "unchanged_streak": s.unchanged_streak,
+                "runs": s.runs,
+            }
+            for s in self.schedules.values()
+        ]
+
+    async def _sync(self, schedule: CategorySchedule) -> str:
+        """
+        Syncs one category, reporting its outcome without raising.
+        """
+        category = schedule.category
+        started = time.monotonic()
+        full = full_sync_due(settings.LOCAL_CACHE_FOLDER, f"table_{category}")
+        mode = "full" if full else "incremental"
+        print(f"[SYNC] Starting {category} sync ({mode})...")
+        try:
+            response = await category_service.sync(
+                category, full=full, scheduled=True
+            )
+            status = response.status
+        except Exception as e:
+            print(f"[SYNC-ERROR] {category} sync failed: {e}")
+            status = "failed"
+
+        schedule.last_duration = time.monotonic() - started
+        print(
+            f"[SYNC] {category} sync {status} in "
+            f"{schedule.last_duration:.1f}s."
+        )
+        return status
+
+    @staticmethod
+    def _reschedule(schedule: CategorySchedule, status: str):
+        """
+        Adapts the interval of a category to the outcome of its sync and
+        schedules its next one.
+        """
+        factor = max(settings.SYNC_BACKOFF_FACTOR, 1.0)
+        if status == "completed":
+            schedule.unchanged_streak = 0
+            schedule.interval = max(
+                min(schedule.interval, schedule.base_interval) / factor,
+                settings.SYNC_MIN_INTERVAL,
+            )
+        elif status == "unchanged":
+            schedule.unchanged_streak += 1
+            schedule.interval = min(
+                schedule.interval * factor, settings.SYNC_MAX_INTERVAL
+            )
+        delay = schedule.interval
+        if status == "failed":
+            delay = min(delay, schedule.base_interval)
+
+        jitter = settings.SYNC_JITTER
+        delay *= 1 + random.uniform(-jitter, jitter)
+        schedule.runs += 1
+        schedule.last_status = status
+        schedule.last_run_at = datetime.now(timezone.utc)
+        schedule.next_run = time.monotonic() + delay
+
+
+sync_scheduler = SyncScheduler()
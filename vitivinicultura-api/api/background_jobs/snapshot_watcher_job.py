@@ -0,0 +1,32 @@
+import asyncio
+from typing import Dict, Optional
+
+from api.core.config import settings
+from api.services import category_service
+
+
+async def snapshot_watch_job():
+    # Only the sync leader writes new versions of the tables; every worker
+    #   watches the published versions and loads new ones into its
+    #   in-memory cache as soon as they appear, instead of on the first
+    #   request that needs them.
+    seen: Dict[str, Optional[str]] = {}
+    while True:
+        for category in category_service.get_categories_list():
+            try:
+                version, _ = await asyncio.to_thread(
+                    category_service.get_dataset_version, category
+                )
+                if seen.get(category) != version:
+                    await asyncio.to_thread(
+                        category_service.warm_cache, category
+                    )
+                    if category in seen:
+                        print(f"[CACHE] Reloaded {category} ({version}).")
+                    seen[category] = version
+            except FileNotFoundError:
+                # Not published yet
+                seen[category] = None
+            except Exception as e:
+                print(f"[WARN] Could not reload {category}: {e}")
+        await asyncio.sleep(settings.SNAPSHOT_POLL_INTERVAL)
@@ -1,26 +1,29 @@
 import asyncio
 
-from api.services import category_service
+from api.background_jobs.scheduler import sync_scheduler
+from api.core.config import settings
+from api.services.leases import Lease
+from api.services.sync_jobs import sync_jobs
 
 
 async def periodic_sync_job():
+    # Every worker runs this job, but only the one holding the scheduler
+    #   lease syncs; the others stand by and take over if it dies. A worker
+    #   losing the lease stops its scheduler and waits for the scrapes
+    #   the scheduler has in flight to stop before standing by; syncs
+    #   requested through the API keep running under their own leases.
+    #   Each category is synced on its own adaptive schedule: see
+    #   api/background_jobs/scheduler.py
+    lease = Lease("scheduler")
+    scheduler = None
     while True:
-        try:
-            print("[SYNC] Starting exportation sync...")
-            await category_service.sync("exportation")
-
-            print("[SYNC] Starting importation sync...")
-            await category_service.sync("importation")
-
-            print("[SYNC] Starting processing sync...")
-            await category_service.sync("processing")
-
-            print("[SYNC] Starting production sync...")
-            await category_service.sync("production")
-
-            print("[SYNC] Starting trade sync...")
-            await category_service.sync("trade")
-        except Exception as e:
-            print(f"[SYNC-ERROR] Sync failed: {e}")
-        print("[SYNC] Waiting 10 minutes before next sync...")
-        await asyncio.sleep(600)  # 10 minutes
+        leader = await lease.acquire_async()
+        if leader and (scheduler is None or scheduler.done()):
+            print("[SYNC] This worker is the sync leader.")
+            scheduler = asyncio.create_task(sync_scheduler.run())
+        elif not leader and scheduler is not None:
+            print("[SYNC] Lost the sync leader lease, stopping the scheduler.")
+            scheduler.cancel()
+            scheduler = None
+            await sync_jobs.cancel_scheduled()
+        await asyncio.sleep(settings.SYNC_LEASE_TTL / 3)
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from pydantic_settings import BaseSettings
 import os
 
@@ -9,22 +11,118 @@ class Settings(BaseSettings):
     Attributes:
         ALGORITHM (str): JWT signing algorithm.
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Expiration duration access tokens.
+        ARTIFACT_BROTLI_QUALITY (int): Brotli quality (0-11) of the
+            precompressed downloads written at sync time. 11 is about
+            twenty times slower than 9 for files about a quarter smaller:
+            see benchmarks/artifacts.py
         DATABASE_URL (str): Database connection string.
         DEBUG (bool): Enables FastAPI debug mode if True.
         EMBRAPA_URL (str): Base URL for the Embrapa website.
         ENV (str): Environment - DEV / PROD
         LOCAL_CACHE_FOLDER (str): Local folder path for caching Embrapa data.
+        PAGE_ARCHIVE_FOLDER (str): Folder where the raw Embrapa pages and
+            the tables parsed from them are archived.
+        RESPONSE_CACHE_MAX_BYTES (int): Memory budget of the serialized
+            response cache, in bytes.
+        SCRAPER_BREAKER_COOLDOWN (float): Seconds requests to Embrapa fail
+            fast once its circuit breaker opens, before a trial request.
+        SCRAPER_BREAKER_THRESHOLD (int): Consecutive failed requests to
+            Embrapa opening its circuit breaker.
+        SCRAPER_CONNECT_TIMEOUT (float): Timeout, in seconds, to connect
+            to Embrapa.
+        SCRAPER_FIXTURE_MODE (str): "record" to capture every page fetched
+            by the scrapers into the fixture archive, "replay" to serve the
+            pages from it without network access; empty to disable.
+        SCRAPER_FIXTURE_PATH (str): Path of the fixture archive of the
+            recorded pages.
+        SCRAPER_HOST_INTERVAL (float): Minimum delay, in seconds, between
+            the starts of two scraper requests to the same host.
+        SCRAPER_MAX_IN_FLIGHT (int): Maximum number of scraper requests in
+            progress at once, and of pooled connections to Embrapa.
+        SCRAPER_PARSE_WORKERS (int): Worker processes parsing the fetched
+            pages; 0 parses them in the fetching threads. Defaults to the
+            number of CPUs.
+        SCRAPER_READ_TIMEOUT (float): Timeout, in seconds, waiting for
+            Embrapa to send data.
+        SCRAPER_RETRY_ATTEMPTS (int): Attempts per scraper request failing
+            with a transient error, including the first one.
+        SCRAPER_RETRY_BASE_DELAY (float): Upper bound, in seconds, of the
+            jittered delay before the first retry; doubled on every retry.
+        SCRAPER_RETRY_MAX_DELAY (float): Upper bound, in seconds, of the
+            delay between two attempts.
         SECRET_KEY (str): Used to sign JWT tokens.
+        SNAPSHOT_POLL_INTERVAL (float): Seconds between two checks, by each
+            worker, for new versions of the cached tables to load.
+        SNAPSHOT_RETENTION (int): Number of most recent versions of each
+            cached table kept on disk, so requests pinned to a replaced
+            version can finish.
+        STREAM_CHUNK_ROWS (int): Rows encoded per chunk when streaming a
+            full table to the client.
+        SYNC_BACKOFF_FACTOR (float): Factor the sync interval of a category
+            is multiplied by after a sync that changed nothing, and divided
+            by after a sync that published changes.
+        SYNC_CATEGORY_INTERVALS (Dict[str, int]): Base sync interval, in
+            seconds, of specific categories, overriding SYNC_INTERVAL.
+        SYNC_CHECKPOINT_MAX_AGE (int): Seconds during which an interrupted
+            sync can be resumed from its checkpoint; older checkpoints are
+            discarded and the sync starts over.
+        SYNC_FULL_INTERVAL (int): Maximum age, in seconds, of the last full
+            sync of a table; once older, the next sync fetches every year
+            again. The syncs in between are incremental.
+        SYNC_INTERVAL (int): Base interval, in seconds, between two syncs
+            of a category.
+        SYNC_JITTER (float): Fraction of the interval randomly added to or
+            removed from each delay, so categories do not sync in lockstep.
+        SYNC_JOB_HISTORY (int): Number of finished sync jobs kept, so their
+            status can still be polled.
+        SYNC_LEASE_TTL (int): Seconds a worker keeps the lease electing it
+            to run the periodic sync, or a category sync, unless renewed;
+            another worker takes over once it expires.
+        SYNC_MAX_INTERVAL (int): Longest interval, in seconds, a category
+            backs off to while its data does not change.
+        SYNC_MIN_INTERVAL (int): Shortest interval, in seconds, a category
+            tightens to while its data keeps changing.
+        SYNC_TRAILING_YEARS (int): Number of most recent years fetched again
+            by every incremental sync.
     """
 
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ARTIFACT_BROTLI_QUALITY: int = 9
     DATABASE_URL: str = "sqlite:///./database/users.db"
     DEBUG: bool = True
     EMBRAPA_URL: str = "http://vitibrasil.cnpuv.embrapa.br/index.php"
     ENV: str = "PROD"
     LOCAL_CACHE_FOLDER: str = os.path.join("data")
+    PAGE_ARCHIVE_FOLDER: str = os.path.join("data", "pages")
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    SCRAPER_BREAKER_COOLDOWN: float = 60.0
+    SCRAPER_BREAKER_THRESHOLD: int = 5
+    SCRAPER_CONNECT_TIMEOUT: float = 10.0
+    SCRAPER_FIXTURE_MODE: str = ""
+    SCRAPER_FIXTURE_PATH: str = os.path.join("data", "fixtures", "embrapa.zip")
+    SCRAPER_HOST_INTERVAL: float = 0.1
+    SCRAPER_MAX_IN_FLIGHT: int = 8
+    SCRAPER_PARSE_WORKERS: int = os.cpu_count() or 1
+    SCRAPER_READ_TIMEOUT: float = 30.0
+    SCRAPER_RETRY_ATTEMPTS: int = 4
+    SCRAPER_RETRY_BASE_DELAY: float = 0.5
+    SCRAPER_RETRY_MAX_DELAY: float = 30.0
     SECRET_KEY: str
+    SNAPSHOT_POLL_INTERVAL: float = 5.0
+    SNAPSHOT_RETENTION: int = 3
+    STREAM_CHUNK_ROWS: int = 1000
+    SYNC_BACKOFF_FACTOR: float = 2.0
+    SYNC_CATEGORY_INTERVALS: Dict[str, int] = {}
+    SYNC_CHECKPOINT_MAX_AGE: int = 24 * 60 * 60
+    SYNC_FULL_INTERVAL: int = 7 * 24 * 60 * 60
+    SYNC_INTERVAL: int = 10 * 60
+    SYNC_JITTER: float = 0.1
+    SYNC_JOB_HISTORY: int = 100
+    SYNC_LEASE_TTL: int = 30
+    SYNC_MAX_INTERVAL: int = 6 * 60 * 60
+    SYNC_MIN_INTERVAL: int = 5 * 60
+    SYNC_TRAILING_YEARS: int = 2
 
     class Config:
         env_file = ".env"
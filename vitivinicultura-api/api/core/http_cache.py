@@ -0,0 +1,110 @@
+"""
+HTTP conditional request utilities (ETag / Last-Modified validators) and
+content-coding negotiation.
+
+Lets read endpoints answer repeated requests for unchanged data with a
+`304 Not Modified` instead of rebuilding the response body.
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Mapping
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong entity tag from the values that identify a response.
+
+    Arguments:
+        *parts: Values identifying the response, such as the dataset version
+            and the normalized query parameters. `None` values are kept, so
+            omitted and explicit parameters produce different tags.
+
+    Returns:
+        str: A quoted strong ETag.
+    """
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    Formats a timezone-aware datetime as an HTTP date (RFC 9110).
+
+    Arguments:
+        value (datetime): The datetime to format.
+
+    Returns:
+        str: The date in GMT, e.g. "Wed, 21 Oct 2015 07:28:00 GMT".
+    """
+    return format_datetime(value, usegmt=True)
+
+
+def is_not_modified(
+    headers: Mapping[str, str], etag: str, last_modified: datetime
+) -> bool:
+    """
+    Evaluates the conditional headers of a GET request.
+
+    `If-None-Match` takes precedence; `If-Modified-Since` is only checked
+    when the client did not send an entity tag.
+
+    Arguments:
+        headers (Mapping[str, str]): Request headers.
+        etag (str): Current ETag of the response.
+        last_modified (datetime): Current modification time of the data.
+
+    Returns:
+        bool: True if the client's cached copy is still valid and a
+            `304 Not Modified` can be returned.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison, as required for If-None-Match
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == etag for tag in candidates
+        )
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+
+    # HTTP dates have a resolution of one second
+    return last_modified.replace(microsecond=0) <= since
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """
+    Checks whether a content coding is acceptable to the client.
+
+    Arguments:
+        accept_encoding (str): Accept-Encoding header of the request.
+        coding (str): Content coding, e.g. "gzip" or "br".
+
+    Returns:
+        bool: True if the coding, or "*", is listed with a non-zero
+            quality value.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    quality = qualities.get(coding, qualities.get("*", 0.0))
+    return quality > 0
@@ -0,0 +1,12 @@
+class CircuitOpenException(Exception):
+    """
+    Raised when a request to the upstream website is refused because its
+    circuit breaker is open after repeated failures.
+
+    Attributes:
+        message (str): Description of the error.
+    """
+
+    def __init__(self, message: str = "Upstream circuit is open."):
+        self.message = message
+        super().__init__(self.message)
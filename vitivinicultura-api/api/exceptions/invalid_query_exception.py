@@ -0,0 +1,12 @@
+class InvalidQueryException(Exception):
+    """
+    Raised when the query parameters of a data request are invalid or
+    inconsistent (e.g. a malformed pagination cursor).
+
+    Attributes:
+        message (str): Description of the error.
+    """
+
+    def __init__(self, message: str = "Invalid query parameters."):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,12 @@
+class SyncCancelledException(Exception):
+    """
+    Raised inside a sync that was cancelled, e.g. because its worker lost
+    the lease of the table, so it stops before writing anything else.
+
+    Attributes:
+        message (str): Description of the error.
+    """
+
+    def __init__(self, message: str = "Sync cancelled."):
+        self.message = message
+        super().__init__(self.message)
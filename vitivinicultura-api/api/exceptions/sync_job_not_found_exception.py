@@ -0,0 +1,12 @@
+class SyncJobNotFoundException(Exception):
+    """
+    Exception raised when a sync job does not exist for a category, or is
+        no longer kept in the job history.
+
+    Attributes:
+        message (str): Description of the error.
+    """
+
+    def __init__(self, message: str = "Sync job not found."):
+        self.message = message
+        super().__init__(self.message)
@@ -10,8 +10,11 @@ from fastapi import FastAPI
 from api.core.config import settings
 from api.routes import auth
 from api.routes import category
+from api.routes import metrics
+from api.services.scrapers.parse_pool import parse_pool
 from database.db import init_db
 
+from api.background_jobs.snapshot_watcher_job import snapshot_watch_job
 from api.background_jobs.sync_categories_job import periodic_sync_job
 
 app = FastAPI(
@@ -27,8 +30,16 @@ async def startup_event():
     init_db()
     if settings.ENV == "PROD":
         asyncio.create_task(periodic_sync_job())
+        asyncio.create_task(snapshot_watch_job())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Stops the processes parsing the scraped pages
+    parse_pool.shutdown()
 
 
 # Register routers
 app.include_router(auth.router)
 app.include_router(category.router)
+app.include_router(metrics.router)
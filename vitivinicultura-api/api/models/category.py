@@ -1,4 +1,7 @@
+from datetime import datetime
 from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -7,11 +10,55 @@ class SyncResponse(BaseModel):
     Represents the status of the sync process.
 
     Attributes:
-        status (str): The status of the synchronization,
-            e.g., "started" or "completed".
+        status (str): The status of the synchronization: "queued",
+            "running", "completed" (a new version was published),
+            "unchanged" or "failed".
+        job_id (Optional[str]): Identifier of the sync job, to poll its
+            status.
+        coalesced (bool): Whether the request joined a sync already
+            requested for the category instead of starting a new one.
+    """
+
+    status: str
+    job_id: Optional[str] = None
+    coalesced: bool = False
+
+
+class SyncJobResponse(BaseModel):
+    """
+    Status and progress of a sync job.
+
+    Attributes:
+        job_id (str): Identifier of the job.
+        category (str): Category being synced.
+        full (bool): Whether every year is fetched again.
+        status (str): "queued", "running", "completed" (a new version was
+            published), "unchanged" or "failed".
+        requests (int): Sync requests served by the job.
+        pages_fetched (int): Pages fetched so far.
+        pages_resumed (int): Pages read back from the checkpoint of an
+            interrupted sync instead of being fetched again.
+        created_at (datetime): When the job was requested.
+        started_at (Optional[datetime]): When the scrape started.
+        finished_at (Optional[datetime]): When the job finished.
+        duration (Optional[float]): Seconds the scrape has been running,
+            or took.
+        snapshot_version (Optional[str]): Version of the table published
+            when the job finished.
     """
 
+    job_id: str
+    category: str
+    full: bool
     status: str
+    requests: int
+    pages_fetched: int
+    pages_resumed: int
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    duration: Optional[float]
+    snapshot_version: Optional[str]
 
 
 class CategoryEnum(str, Enum):
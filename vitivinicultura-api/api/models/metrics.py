@@ -0,0 +1,93 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Counters of the in-memory dataset cache of this API process.
+
+    Attributes:
+        hits (int): Requests served from tables already in memory.
+        misses (int): Requests that had to read a table from disk.
+        reloads (int): Misses caused by a table changing on disk after
+            a sync.
+        entries (int): Number of tables currently held in memory.
+    """
+
+    hits: int
+    misses: int
+    reloads: int
+    entries: int
+
+
+class ResponseCacheStatsResponse(BaseModel):
+    """
+    Counters of the serialized response cache of this API process.
+
+    Attributes:
+        hits (int): Requests answered with previously encoded bytes.
+        misses (int): Requests whose response had to be encoded.
+        hit_ratio (float): hits / (hits + misses).
+        evictions (int): Entries dropped to stay within the byte budget.
+        invalidations (int): Entries dropped because their dataset was
+            replaced by a sync (the version just replaced is kept).
+        entries (int): Number of responses currently cached.
+        size_bytes (int): Total size of the cached responses.
+        max_bytes (int): Byte budget of the cache.
+    """
+
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class CategoryScheduleResponse(BaseModel):
+    """
+    Sync schedule of one category.
+
+    Attributes:
+        category (str): Name of the category.
+        base_interval (float): Configured interval between syncs, in
+            seconds.
+        interval (float): Current interval, adapted to how often the data
+            changes, in seconds.
+        next_run_at (datetime): When the next sync is due.
+        last_run_at (Optional[datetime]): When the last sync finished.
+        last_status (Optional[str]): Outcome of the last sync: "completed",
+            "unchanged" or "failed".
+        last_duration (Optional[float]): Duration of the last sync, in
+            seconds.
+        unchanged_streak (int): Consecutive syncs that changed nothing.
+        runs (int): Syncs run since the process started.
+    """
+
+    category: str
+    base_interval: float
+    interval: float
+    next_run_at: datetime
+    last_run_at: Optional[datetime]
+    last_status: Optional[str]
+    last_duration: Optional[float]
+    unchanged_streak: int
+    runs: int
+
+
+class ScheduleResponse(BaseModel):
+    """
+    Sync schedule of this API process.
+
+    Attributes:
+        running (bool): Whether the periodic sync job runs in this process.
+        categories (List[CategoryScheduleResponse]): Schedule of each
+            category.
+    """
+
+    running: bool
+    categories: List[CategoryScheduleResponse]
@@ -1,19 +1,23 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     HTTPException,
     status,
     Query,
     Request,
 )
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
-from api.models.category import CategoryEnum, SyncResponse
+from api.models.category import CategoryEnum, SyncJobResponse, SyncResponse
 
+from api.core.http_cache import format_http_date, is_not_modified, make_etag
 from api.core.security import get_current_user
+from api.exceptions.invalid_query_exception import InvalidQueryException
 from api.exceptions.scraper_not_found_exception import ScraperNotFoundException
+from api.exceptions.sync_job_not_found_exception import (
+    SyncJobNotFoundException,
+)
 from api.services import category_service
 
 router = APIRouter(prefix="/category", tags=["category"])
@@ -44,16 +48,28 @@ async def get_categories_list(
     "/{category}/sync",
     summary="Fetch viticulture data from Embrapa and update the cache",
     status_code=status.HTTP_202_ACCEPTED,
+    response_model=SyncResponse,
 )
 async def sync_category(
     category: CategoryEnum,
-    background_tasks: BackgroundTasks,
     user: str = Depends(get_current_user),
+    full: bool = Query(
+        False,
+        description=(
+            "Fetch every year again instead of only the missing and most "
+            "recent years (optional)"
+        ),
+    ),
 ) -> SyncResponse:
     """
     Triggers the scraper to fetch and store new viticulture data for a specific
         category asynchronously.
 
+    Requests for a category with a sync already in flight join it instead
+    of starting another one; a full sync requested while an incremental one
+    runs is queued behind it. The returned job ID can be polled at
+    `GET /category/{category}/sync/{job_id}`.
+
     Valid categories:
         - exportation
         - importation
@@ -63,20 +79,22 @@ async def sync_category(
 
     Args:
         category (CategoryEnum): The viticulture data category.
-        background_tasks (BackgroundTasks): Used to run the sync process in
-            the background.
         user (str): Authenticated user (injected via Depends).
+        full (bool): Whether to run a full sync instead of an incremental
+            one.
 
     Returns:
-        SyncResponse: Confirmation that the sync process has been initiated.
+        SyncResponse: The job serving the request and its status.
 
     Raises:
         HTTPException:
             - 404 if no scraper exists for the specified category.
     """
     try:
-        background_tasks.add_task(category_service.sync, category.value)
-        return SyncResponse(status="started")
+        job = category_service.start_sync(category.value, full=full)
+        return SyncResponse(
+            status=job.state, job_id=job.job_id, coalesced=job.requests > 1
+        )
     except ScraperNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,6 +102,57 @@ async def sync_category(
         )
 
 
+@router.get(
+    "/{category}/sync/{job_id}",
+    summary="Get the status of a sync job",
+    status_code=status.HTTP_200_OK,
+    response_model=SyncJobResponse,
+)
+async def get_sync_job(
+    category: CategoryEnum,
+    job_id: str,
+    user: str = Depends(get_current_user),
+) -> SyncJobResponse:
+    """
+    Returns the state, progress and outcome of a sync job.
+
+    Args:
+        category (CategoryEnum): The viticulture data category.
+        job_id (str): Identifier returned by `POST /category/{category}/sync`.
+        user (str): Authenticated user (injected via Depends).
+
+    Returns:
+        SyncJobResponse: The job status, pages fetched, duration and the
+            version of the table published when it finished.
+
+    Raises:
+        HTTPException:
+            - 404 if the category is not supported, or the job is unknown
+              or no longer kept.
+    """
+    try:
+        job = category_service.get_sync_job(category.value, job_id)
+    except (ScraperNotFoundException, SyncJobNotFoundException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        )
+    return SyncJobResponse(
+        job_id=job.job_id,
+        category=job.category,
+        full=job.full,
+        status=job.state,
+        requests=job.requests,
+        pages_fetched=job.pages_fetched,
+        pages_resumed=job.pages_resumed,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        duration=job.duration,
+        snapshot_version=job.snapshot_version,
+    )
+
+
 @router.get(
     "/{category}",
     summary="Fetch viticulture data from cached data",
@@ -104,7 +173,13 @@ async def sync_category(
                 "text/csv": {
                     "example": (
                         "Produto,Quantidade (L.),ano,Categoria\n"
-                        "Tinto,174224052.0,1970,VINHO DE MESA\n"
+                        "Tinto,174224052,1970,VINHO DE MESA\n"
+                    )
+                },
+                "application/x-ndjson": {
+                    "example": (
+                        '{"Produto":"Tinto","Quantidade (L.)":174224052,'
+                        '"ano":1970,"Categoria":"VINHO DE MESA"}\n'
                     )
                 },
             },
@@ -126,6 +201,43 @@ def get_category(
     year: Optional[int] = Query(
         None, description="Filter data by year (optional)"
     ),
+    year_from: Optional[int] = Query(
+        None, description="First year of the range to return (optional)"
+    ),
+    year_to: Optional[int] = Query(
+        None, description="Last year of the range to return (optional)"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque cursor from the X-Next-Cursor header of the previous "
+            "page (optional, cannot be combined with offset)"
+        ),
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated columns to return, e.g. 'ano,pais' "
+            "(optional, all columns if omitted)"
+        ),
+    ),
+    pais: Optional[List[str]] = Query(
+        None, description="Filter by country; repeat for several (optional)"
+    ),
+    produto: Optional[List[str]] = Query(
+        None, description="Filter by product; repeat for several (optional)"
+    ),
+    cultivo: Optional[List[str]] = Query(
+        None, description="Filter by cultivar; repeat for several (optional)"
+    ),
+    subopcao: Optional[List[str]] = Query(
+        None,
+        description="Filter by sub-option; repeat for several (optional)",
+    ),
+    categoria: Optional[List[str]] = Query(
+        None,
+        description="Filter by category; repeat for several (optional)",
+    ),
 ):
     """
     Return cached viticulture data in the format requested by the client
@@ -141,6 +253,27 @@ def get_category(
     Supported content types via Accept header:
         - application/json (default)
         - text/csv
+        - application/x-ndjson (newline-delimited JSON)
+
+    When no offset or limit is given, the whole selection is streamed in
+    chunks instead of being built in memory before responding. Unfiltered
+    downloads are instead sent from gzip or brotli files written at sync
+    time, when the Accept-Encoding header allows it.
+
+    Paginated responses include an X-Next-Cursor header (and a Link header
+    with rel="next") while more rows remain. Passing it back as `cursor`
+    returns the next page in O(limit), and keeps paging consistent if a
+    sync replaces the data in between.
+
+    Rows can be filtered by the dimension columns defined by the category
+    schema (pais, produto, cultivo, subopcao, categoria). Repeating a filter
+    accepts any of its values (e.g. `pais=Argentina&pais=Chile`). Filters
+    are answered from value indexes built when the table is loaded.
+
+    Responses carry an ETag (dataset version plus query) and Last-Modified
+    (time of the last sync). Requests with a matching If-None-Match, or an
+    If-Modified-Since not older than the last sync, get a 304 without the
+    data being read.
 
     Args:
         category (CategoryEnum): Category of viticulture data.
@@ -149,12 +282,26 @@ def get_category(
         offset (Optional[int]): Number of items to skip (optional).
         limit (Optional[int]): Max number of items to return (optional).
         year (Optional[int]): Filter data by a specific year (optional).
+            Takes precedence over year_from and year_to.
+        year_from (Optional[int]): First year of the range (optional).
+        year_to (Optional[int]): Last year of the range (optional).
+        cursor (Optional[str]): Cursor of the page to return (optional).
+        fields (Optional[str]): Columns to return (optional).
+        pais (Optional[List[str]]): Countries to return (optional).
+        produto (Optional[List[str]]): Products to return (optional).
+        cultivo (Optional[List[str]]): Cultivars to return (optional).
+        subopcao (Optional[List[str]]): Sub-options to return (optional).
+        categoria (Optional[List[str]]): Categories to return (optional).
 
     Returns:
-        JSONResponse or PlainTextResponse: The data in requested format.
+        Response or StreamingResponse: The data in requested format, or an
+            empty 304 Response if the client's copy is still current.
 
     Raises:
         HTTPException:
+            - 400 if the cursor is invalid, combined with offset, or
+              ambiguous after a sync changed the rows it points into, or
+              if a field or filter is not defined for the category.
             - 404 if the category is not supported.
             - 406 if an unsupported media type is requested.
     """
@@ -165,34 +312,296 @@ def get_category(
         # Swagger UI often struggles with very large datasets.
         # Therefore, we set a default offset of 1 to avoid
         #   loading too much data at once.
-        if "/docs" in referer and offset is None:
+        if "/docs" in referer and offset is None and cursor is None:
             offset = 1
 
-        if "text/csv" in accept:
-            csv_content = category_service.get_csv(
-                category.value, offset=offset, limit=limit, year=year
+        media_type = _negotiate_media_type(accept)
+
+        # Every read below uses the version of the table published when the
+        #   request arrived, even if a sync publishes a new one meanwhile.
+        snapshot = category_service.pin_snapshot(category.value)
+
+        filters = dict(
+            year=year,
+            year_from=year_from,
+            year_to=year_to,
+            fields=_split_list(fields),
+            dimensions=dict(
+                pais=pais,
+                produto=produto,
+                cultivo=cultivo,
+                subopcao=subopcao,
+                categoria=categoria,
+            ),
+        )
+
+        # Unfiltered full-table downloads are sent precompressed when a
+        #   current artifact exists in an encoding the client accepts.
+        full_download = offset is None and limit is None and cursor is None
+        artifact = None
+        if full_download and _is_unfiltered(filters):
+            artifact = category_service.get_artifact(
+                category.value,
+                media_type,
+                request.headers.get("accept-encoding", ""),
+                snapshot=snapshot,
             )
-            return PlainTextResponse(
-                content=csv_content, media_type="text/csv"
+        coding = artifact[1] if artifact is not None else None
+
+        # Answer revalidations from the dataset version alone, before any
+        #   data is loaded or serialized.
+        headers, not_modified = _check_validators(
+            request,
+            category.value,
+            snapshot,
+            media_type,
+            offset,
+            limit,
+            cursor,
+            filters,
+            coding,
+        )
+        if full_download:
+            headers["Vary"] = "Accept, Accept-Encoding"
+        if not_modified:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
             )
 
-        elif "application/json" in accept or "*/*" in accept or not accept:
-            json_content = category_service.get_json(
-                category.value, offset=offset, limit=limit, year=year
+        if artifact is not None:
+            headers["Content-Encoding"] = coding
+            return FileResponse(
+                artifact[0], media_type=media_type, headers=headers
             )
-            return JSONResponse(content=json_content)
-
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_406_NOT_ACCEPTABLE,
-                detail=(
-                    "Unsupported response type. "
-                    "Use 'application/json' or 'text/csv'."
+
+        # Other full-table downloads are streamed in chunks, so the whole
+        #   table is never materialized in memory at once.
+        if full_download:
+            return StreamingResponse(
+                category_service.stream(
+                    category.value, media_type, snapshot=snapshot, **filters
                 ),
+                media_type=media_type,
+                headers=headers,
+            )
+
+        # Pages are small and frequently repeated: serve their encoded
+        #   bytes from the response cache.
+        content, next_cursor = category_service.render(
+            category.value,
+            media_type,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            snapshot=snapshot,
+            **filters,
+        )
+        if next_cursor is not None:
+            next_url = request.url.remove_query_params("offset")
+            next_url = next_url.include_query_params(cursor=next_cursor)
+            headers["X-Next-Cursor"] = next_cursor
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return Response(
+            content=content, media_type=media_type, headers=headers
+        )
+
+    except ScraperNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        )
+    except InvalidQueryException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+
+
+@router.get(
+    "/{category}/aggregate",
+    summary="Aggregate viticulture data from cached data",
+    responses={
+        200: {
+            "description": "Successful request, aggregation returned",
+            "content": {
+                "application/json": {
+                    "example": [
+                        {"ano": 1970, "sum:Quantidade (L.)": 256370050},
+                    ]
+                },
+                "text/csv": {
+                    "example": "ano,sum:Quantidade (L.)\n1970,256370050\n"
+                },
+            },
+        }
+    },
+)
+def aggregate_category(
+    category: CategoryEnum,
+    request: Request,
+    user: str = Depends(get_current_user),
+    group_by: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated columns to group by, e.g. 'ano,Produto' "
+            "(optional, totals only if omitted)"
+        ),
+    ),
+    metrics: str = Query(
+        ...,
+        description=(
+            "Comma-separated aggregations as 'function:column', e.g. "
+            "'sum:Quantidade (L.)'. Functions: sum, mean, min, max, count"
+        ),
+    ),
+    year: Optional[int] = Query(
+        None, description="Filter data by year (optional)"
+    ),
+    year_from: Optional[int] = Query(
+        None, description="First year of the range to aggregate (optional)"
+    ),
+    year_to: Optional[int] = Query(
+        None, description="Last year of the range to aggregate (optional)"
+    ),
+):
+    """
+    Return an aggregation of the cached viticulture data, computed on the
+        server, in the format requested by the client (CSV or JSON).
+
+    Columns can be given by their name in the table (e.g. "Países") or by
+    their schema field name (e.g. "pais"). Results are cached until the next
+    sync, and carry the same ETag / Last-Modified validators as
+    `GET /category/{category}`.
+
+    Args:
+        category (CategoryEnum): Category of viticulture data.
+        request (Request): FastAPI request object (used to inspect headers).
+        user (str): Authenticated user.
+        group_by (Optional[str]): Columns to group by (optional).
+        metrics (str): Aggregations to compute.
+        year (Optional[int]): Filter data by a specific year (optional).
+            Takes precedence over year_from and year_to.
+        year_from (Optional[int]): First year of the range (optional).
+        year_to (Optional[int]): Last year of the range (optional).
+
+    Returns:
+        Response: One record per group, or an empty 304 Response if the
+            client's copy is still current.
+
+    Raises:
+        HTTPException:
+            - 400 if a column or aggregation function is not supported.
+            - 404 if the category is not supported.
+            - 406 if an unsupported media type is requested.
+    """
+    try:
+        media_type = _negotiate_media_type(request.headers.get("accept", ""))
+        keys = _split_list(group_by)
+        aggregations = _split_list(metrics)
+        filters = dict(year=year, year_from=year_from, year_to=year_to)
+        snapshot = category_service.pin_snapshot(category.value)
+
+        headers, not_modified = _check_validators(
+            request,
+            category.value,
+            snapshot,
+            "aggregate",
+            media_type,
+            keys,
+            aggregations,
+            filters,
+        )
+        if not_modified:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
             )
 
+        content = category_service.aggregate(
+            category.value,
+            media_type,
+            keys,
+            aggregations,
+            snapshot=snapshot,
+            **filters,
+        )
+        return Response(
+            content=content, media_type=media_type, headers=headers
+        )
+
     except ScraperNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    except InvalidQueryException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+
+
+def _negotiate_media_type(accept: str) -> str:
+    """
+    Picks the response media type from the Accept header.
+
+    Raises:
+        HTTPException: 406 if no supported media type is acceptable.
+    """
+    if "text/csv" in accept:
+        return "text/csv"
+    if "application/x-ndjson" in accept:
+        return "application/x-ndjson"
+    if "application/json" in accept or "*/*" in accept or not accept:
+        return "application/json"
+    raise HTTPException(
+        status_code=status.HTTP_406_NOT_ACCEPTABLE,
+        detail=(
+            "Unsupported response type. "
+            "Use 'application/json', 'application/x-ndjson' "
+            "or 'text/csv'."
+        ),
+    )
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    """
+    Splits a comma-separated query parameter, ignoring empty items.
+    """
+    items = (item.strip() for item in (value or "").split(","))
+    return [item for item in items if item]
+
+
+def _is_unfiltered(filters: dict) -> bool:
+    """
+    Checks whether a read selects every row and column of the table.
+    """
+    if filters["fields"] or any(filters["dimensions"].values()):
+        return False
+    return all(
+        filters[key] is None for key in ("year", "year_from", "year_to")
+    )
+
+
+def _check_validators(
+    request: Request, category: str, snapshot: str, *query
+) -> Tuple[dict, bool]:
+    """
+    Builds the validator headers of a read response from the version of
+    the pinned table and the normalized query, and evaluates the request's
+    conditional headers against them.
+
+    Returns:
+        Tuple[dict, bool]: The response headers, and whether a
+            `304 Not Modified` can be returned.
+    """
+    version, synced_at = category_service.get_dataset_version(
+        category, snapshot
+    )
+    etag = make_etag(version, category, *query)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_http_date(synced_at),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept",
+    }
+    return headers, is_not_modified(request.headers, etag, synced_at)
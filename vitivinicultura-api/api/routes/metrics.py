@@ -0,0 +1,95 @@
+"""
+Operational metrics routes: expose the internal counters of this API
+process, such as the dataset and response cache statistics, and the
+schedule of the category syncs.
+"""
+
+from fastapi import APIRouter, Depends, status
+
+from api.background_jobs.scheduler import sync_scheduler
+from api.core.security import get_current_user
+from api.models.metrics import (
+    CacheStatsResponse,
+    ResponseCacheStatsResponse,
+    ScheduleResponse,
+)
+from api.services import category_service
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/cache",
+    summary="Get dataset cache statistics",
+    status_code=status.HTTP_200_OK,
+    response_model=CacheStatsResponse,
+)
+async def get_cache_stats(
+    user: str = Depends(get_current_user),
+) -> CacheStatsResponse:
+    """
+    Returns the hit/miss counters of the in-memory dataset cache.
+
+    Counters are kept per process, so each worker reports its own values.
+
+    Args:
+        user (str): Authenticated user (injected via Depends).
+
+    Returns:
+        CacheStatsResponse: Current cache counters.
+    """
+    return CacheStatsResponse(**category_service.get_cache_stats())
+
+
+@router.get(
+    "/responses",
+    summary="Get serialized response cache statistics",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseCacheStatsResponse,
+)
+async def get_response_cache_stats(
+    user: str = Depends(get_current_user),
+) -> ResponseCacheStatsResponse:
+    """
+    Returns the hit ratio, eviction and invalidation counters of the
+    serialized response cache.
+
+    Counters are kept per process, so each worker reports its own values.
+
+    Args:
+        user (str): Authenticated user (injected via Depends).
+
+    Returns:
+        ResponseCacheStatsResponse: Current cache counters.
+    """
+    return ResponseCacheStatsResponse(
+        **category_service.get_response_cache_stats()
+    )
+
+
+@router.get(
+    "/schedule",
+    summary="Get the sync schedule of each category",
+    status_code=status.HTTP_200_OK,
+    response_model=ScheduleResponse,
+)
+async def get_schedule(
+    user: str = Depends(get_current_user),
+) -> ScheduleResponse:
+    """
+    Returns the adaptive sync schedule of each category: its current
+    interval, the outcome of its last sync and when the next one is due.
+
+    The schedule is kept per process; it only advances in the process
+    running the periodic sync job.
+
+    Args:
+        user (str): Authenticated user (injected via Depends).
+
+    Returns:
+        ScheduleResponse: Current schedule.
+    """
+    return ScheduleResponse(
+        running=sync_scheduler.running,
+        categories=sync_scheduler.describe(),
+    )
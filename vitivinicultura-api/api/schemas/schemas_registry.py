@@ -1,3 +1,5 @@
+from typing import Dict
+
 from api.schemas.exportation import ExportationItem
 from api.schemas.importation import ImportationItem
 from api.schemas.production import ProductionItem
@@ -11,3 +13,39 @@ schemas_registry = {
     "trade": TradeItem,
     "processing": ProcessingItem,
 }
+
+# Schema fields holding the descriptive (non-measure) values of an item
+dimension_fields = ("pais", "produto", "cultivo", "subopcao", "categoria")
+
+
+def get_columns(category: str) -> Dict[str, str]:
+    """
+    Returns the columns defined by the schema of a category.
+
+    Args:
+        category (str): Name of the data category.
+
+    Returns:
+        Dict[str, str]: Maps each field name (e.g. "pais") to the column
+            holding it in the cached table (e.g. "Países").
+    """
+    fields = schemas_registry[category].model_fields
+    return {name: field.alias or name for name, field in fields.items()}
+
+
+def get_dimension_columns(category: str) -> Dict[str, str]:
+    """
+    Returns the dimension columns defined by the schema of a category.
+
+    Args:
+        category (str): Name of the data category.
+
+    Returns:
+        Dict[str, str]: Maps each dimension field name (e.g. "pais") to the
+            column holding it in the cached table (e.g. "Países").
+    """
+    return {
+        name: column
+        for name, column in get_columns(category).items()
+        if name in dimension_fields
+    }
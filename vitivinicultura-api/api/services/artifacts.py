@@ -0,0 +1,162 @@
+"""
+Precompressed full-table downloads.
+
+After each sync, the snapshot of a table is encoded once in every supported
+format and compressed with gzip and brotli. Full-table downloads are then
+served as a file send of the matching artifact instead of being serialized
+and compressed per request.
+
+A manifest written after the artifacts records the version of the snapshot
+they were encoded from; artifacts are only served while that snapshot is
+still the current one.
+"""
+
+import gzip
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import brotli
+
+from api.core.config import settings
+from api.core.http_cache import accepts_encoding
+from api.services import serializers
+from api.services.dataset_cache import Dataset, file_version
+from api.services.snapshot import read_snapshot, snapshot_path
+
+# File extension of the artifact of each media type
+FORMAT_EXTENSIONS: Dict[str, str] = {
+    "text/csv": "csv",
+    "application/json": "json",
+    "application/x-ndjson": "ndjson",
+}
+
+# Content codings produced, in order of preference, with their extensions
+CODING_EXTENSIONS: Dict[str, str] = {
+    "br": "br",
+    "gzip": "gz",
+}
+
+# Compression is paid once per sync rather than per request
+GZIP_LEVEL = 9
+
+# Rows encoded at a time while writing the artifacts
+CHUNK_ROWS = 10000
+
+
+def artifact_path(
+    file_path: str, file_name: str, media_type: str, coding: str
+) -> str:
+    """
+    Returns the path of a precompressed artifact.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        media_type (str): Media type of the encoded table.
+        coding (str): Content coding ("br" or "gzip").
+
+    Returns:
+        str: Path of the artifact, e.g. "table_trade.csv.gz".
+    """
+    extension = FORMAT_EXTENSIONS[media_type]
+    return os.path.join(
+        file_path, f"{file_name}.{extension}.{CODING_EXTENSIONS[coding]}"
+    )
+
+
+def write_artifacts(file_path: str, file_name: str):
+    """
+    Encodes the snapshot of a table in every supported format and writes
+    each encoding compressed with every supported content coding.
+
+    Each artifact is written under a temporary name and then renamed; the
+    manifest pairing them with the snapshot is replaced last.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Raises:
+        FileNotFoundError: If the table has no snapshot.
+    """
+    path = snapshot_path(file_path, file_name)
+    version = file_version(path)[0]
+    # Same row order as the tables served by the API
+    df = Dataset(read_snapshot(path), path, version).df
+
+    for media_type in FORMAT_EXTENSIONS:
+        paths = {
+            coding: artifact_path(file_path, file_name, media_type, coding)
+            for coding in CODING_EXTENSIONS
+        }
+        with open(f"{paths['gzip']}.tmp", "wb") as gz_file, open(
+            f"{paths['br']}.tmp", "wb"
+        ) as br_file:
+            compressor = brotli.Compressor(
+                mode=brotli.MODE_TEXT, quality=settings.ARTIFACT_BROTLI_QUALITY
+            )
+            with gzip.GzipFile(
+                fileobj=gz_file, mode="wb", compresslevel=GZIP_LEVEL, mtime=0
+            ) as gz_stream:
+                encoder = serializers.ENCODERS[media_type]
+                for chunk in encoder(df, CHUNK_ROWS):
+                    data = chunk.encode("utf-8")
+                    gz_stream.write(data)
+                    br_file.write(compressor.process(data))
+            br_file.write(compressor.finish())
+        for artifact in paths.values():
+            os.replace(f"{artifact}.tmp", artifact)
+
+    manifest = _manifest_path(file_path, file_name)
+    with open(f"{manifest}.tmp", "w", encoding="utf-8") as file:
+        json.dump({"snapshot": version}, file)
+    os.replace(f"{manifest}.tmp", manifest)
+
+
+def find_artifact(
+    file_path: str, file_name: str, media_type: str, accept_encoding: str
+) -> Optional[Tuple[str, str]]:
+    """
+    Looks up a current artifact of a table that the client can decode.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        media_type (str): Media type of the response.
+        accept_encoding (str): Accept-Encoding header of the request.
+
+    Returns:
+        Optional[Tuple[str, str]]: Path and content coding of the
+            artifact, or None if there is no acceptable and current one.
+    """
+    if media_type not in FORMAT_EXTENSIONS:
+        return None
+    codings = [
+        coding
+        for coding in CODING_EXTENSIONS
+        if accepts_encoding(accept_encoding, coding)
+    ]
+    if not codings:
+        return None
+
+    try:
+        with open(
+            _manifest_path(file_path, file_name), encoding="utf-8"
+        ) as file:
+            manifest = json.load(file)
+        version = file_version(snapshot_path(file_path, file_name))[0]
+    except (OSError, ValueError):
+        return None
+    if manifest.get("snapshot") != version:
+        return None
+
+    for coding in codings:
+        path = artifact_path(file_path, file_name, media_type, coding)
+        if os.path.exists(path):
+            return path, coding
+    return None
+
+
+def _manifest_path(file_path: str, file_name: str) -> str:
+    return os.path.join(file_path, f"{file_name}.artifacts.json")
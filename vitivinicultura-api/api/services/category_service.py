@@ -1,29 +1,33 @@
-import asyncio
 import os
 import pandas as pd
-from typing import List, Optional
+from bisect import bisect_left
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from api.core.config import settings
+from api.exceptions.invalid_query_exception import InvalidQueryException
 from api.exceptions.scraper_not_found_exception import ScraperNotFoundException
+from api.exceptions.sync_job_not_found_exception import (
+    SyncJobNotFoundException,
+)
 from api.models.category import SyncResponse
+from api.schemas.schemas_registry import get_columns, get_dimension_columns
+from api.services import artifacts, serializers, snapshot_store
+from api.services.cursor import decode_cursor, encode_cursor
+from api.services.dataset_cache import (
+    YEAR_COLUMN,
+    Dataset,
+    dataset_cache,
+    file_version,
+)
+from api.services.response_cache import response_cache
+from api.services.snapshot import read_snapshot, snapshot_path, to_typed
 
-from api.services.scrapers.exportation_scraper import ExportationScraper
-from api.services.scrapers.importation_scraper import ImportationScraper
-from api.services.scrapers.production_scraper import ProductionScraper
-from api.services.scrapers.processing_scraper import ProcessingScraper
-from api.services.scrapers.trade_scraper import TradeScraper
+from api.services.scrapers.specs import ScraperSpec, scraper_specs
+from api.services.sync_jobs import SyncJob, sync_jobs
 
-# Maps category names to their corresponding scraper classes
-__scrapers_registry = {
-    "exportation": ExportationScraper,
-    "importation": ImportationScraper,
-    "processing": ProcessingScraper,
-    "production": ProductionScraper,
-    "trade": TradeScraper,
-}
-
-# Year field
-__year_filter = "ano"
+# Aggregation functions accepted by `aggregate`
+__aggregations = ("sum", "mean", "min", "max", "count")
 
 
 def get_categories_list() -> List[str]:
@@ -34,137 +38,712 @@ def get_categories_list() -> List[str]:
         list[str]: A list of keys representing the registered
             categories.
     """
-    return list(__scrapers_registry.keys())
+    return list(scraper_specs.keys())
+
+
+def start_sync(
+    category: str, full: bool = False, scheduled: bool = False
+) -> SyncJob:
+    """
+    Requests a sync of the specified category. Requests are coalesced onto
+    the sync already in flight for the category, if it covers them.
+
+    By default only the years missing from the cached table and the most
+    recent years (SYNC_TRAILING_YEARS) are fetched and merged into it.
+
+    Args:
+        category (str): Name of the data category (e.g., "exportation").
+        full (bool): Fetch every year again instead of syncing
+            incrementally.
+        scheduled (bool): Whether the request comes from the scheduler;
+            such jobs are cancelled if the worker stops being the leader.
+
+    Returns:
+        SyncJob: The job serving the request, running in the background.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    _get_spec(category)
+    return sync_jobs.submit(category.lower(), full, scheduled)
 
 
-async def sync(category: str) -> SyncResponse:
+async def sync(
+    category: str, full: bool = False, scheduled: bool = False
+) -> SyncResponse:
     """
     Executes the scraper for the specified category, caches the data locally,
-    and returns the sync status.
+    and returns the sync status once it finished.
 
     Args:
         category (str): Name of the data category (e.g., "exportation").
+        full (bool): Fetch every year again instead of syncing
+            incrementally.
+        scheduled (bool): Whether the request comes from the scheduler.
 
     Returns:
-        SyncResponse: An object indicating "started".
+        SyncResponse: The job that ran the sync and its status: "completed"
+            when a new version of the table was published, "unchanged" when
+            the fetched table was identical to the published one, or
+            "failed".
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
     """
-    scraper_class = _get_category_class(category)
-    await asyncio.to_thread(
-        scraper_class.sync,
-        settings.EMBRAPA_URL,
-        settings.LOCAL_CACHE_FOLDER,
-        f"table_{category}",
-    )
-    return SyncResponse(status="started")
+    job = await start_sync(category, full, scheduled).wait()
+    return SyncResponse(status=job.state, job_id=job.job_id)
+
+
+def get_sync_job(category: str, job_id: str) -> SyncJob:
+    """
+    Returns a sync job of a category.
+
+    Args:
+        category (str): Name of the data category.
+        job_id (str): Identifier returned when the sync was requested.
+
+    Returns:
+        SyncJob: The job, running or finished.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+        SyncJobNotFoundException: If the job is unknown, or too old to be
+            kept.
+    """
+    _get_spec(category)
+    job = sync_jobs.get(category.lower(), job_id)
+    if job is None:
+        raise SyncJobNotFoundException(
+            f"Sync job '{job_id}' not found for category "
+            f"'{category.lower()}'."
+        )
+    return job
 
 
-def get_csv(
+def render(
     category: str,
+    media_type: str,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     year: Optional[int] = None,
-) -> str:
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    dimensions: Optional[Dict[str, List[str]]] = None,
+    snapshot: Optional[str] = None,
+) -> Tuple[bytes, Optional[str]]:
     """
-    Reads the cached CSV file for the given category and returns
-    its paginated content as a CSV string.
+    Returns the encoded body of one page of the cached table, reusing the
+    bytes of a previous identical page while the dataset is unchanged.
 
-    If offset and limit are not provided, returns the entire dataset.
+    Pages are addressed either by offset or by an opaque cursor returned
+    with the previous page. Resuming from a cursor costs O(limit) and stays
+    consistent when a sync replaces the table between pages: the cursor
+    remembers the last row returned and the next page starts after it.
 
     Args:
         category (str): Name of the data category.
+        media_type (str): "text/csv", "application/json" or
+            "application/x-ndjson".
         offset (int, optional): Number of items to skip. Default is 0.
         limit (int, optional): Maximum number of items to return.
             Default is 100.
-        year (int, optional): Year to filter the data by.
+        year (int, optional): Year to filter the data by. Takes precedence
+            over year_from and year_to.
+        year_from (int, optional): First year of the range to return.
+        year_to (int, optional): Last year of the range to return.
+        cursor (str, optional): Cursor returned with the previous page.
+        fields (List[str], optional): Columns to return, given as table
+            columns or schema field names. All columns if omitted.
+        dimensions (Dict[str, List[str]], optional): Accepted values of
+            dimension fields (e.g. {"pais": ["Argentina"]}), resolved
+            through the value indexes of the table.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
 
     Returns:
-        str: Paginated CSV content or full dataset if no pagination
-            is requested.
+        Tuple[bytes, Optional[str]]: The encoded page and the cursor of the
+            next page (None on the last page).
+
+    Raises:
+        InvalidQueryException: If the cursor is malformed, belongs to
+            another query, or is combined with an offset, or if a field or
+            dimension is not defined for the category.
     """
-    _get_category_class(category)
+    if cursor is not None and offset is not None:
+        raise InvalidQueryException("Use either offset or cursor, not both.")
 
-    filepath = os.path.join(
-        settings.LOCAL_CACHE_FOLDER, f"table_{category}.csv"
-    )
-    df = pd.read_csv(filepath, dtype={__year_filter: int})
+    dataset = _get_dataset(category, snapshot)
 
     if year is not None:
-        df = df[df[__year_filter] == year]
-
-    if offset is None and limit is None:
-        paginated_df = df
+        year_from = year_to = year
+    limit = limit if limit is not None else 100
+    columns = _resolve_fields(category, dataset, fields)
+    filters = _resolve_dimensions(category, dataset, dimensions)
+    query = [category, year_from, year_to, filters]
+    rows = dataset.select(year_from, year_to, filters)
+
+    if cursor is None:
+        page_start = min(offset or 0, len(rows))
     else:
-        paginated_offset = offset if offset is not None else 0
-        paginated_limit = limit if limit is not None else 100
-        paginated_df = df.iloc[
-            paginated_offset : paginated_offset + paginated_limit
-        ]
+        position = _resume_position(dataset, decode_cursor(cursor), query)
+        page_start = bisect_left(rows, position)
+    page_stop = min(page_start + limit, len(rows))
+
+    # Pages are cached by their position in the selection, so offset and
+    #   cursor requests for the same rows share one entry.
+    key = (media_type, columns, year_from, year_to, _filters_key(filters))
+    key += (page_start, page_stop)
+    body = response_cache.get(category, key, dataset.version)
+    if body is None:
+        df = dataset.take(rows[page_start:page_stop], columns)
+        body = serializers.encode(df, media_type)
+        response_cache.put(category, key, dataset.version, body)
+
+    next_cursor = None
+    if page_start < page_stop < len(rows):
+        last_position = int(rows[page_stop - 1])
+        next_cursor = _make_cursor(dataset, last_position + 1, query)
+    return body, next_cursor
+
+
+def aggregate(
+    category: str,
+    media_type: str,
+    group_by: List[str],
+    metrics: List[str],
+    year: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    snapshot: Optional[str] = None,
+) -> bytes:
+    """
+    Aggregates the cached table with a vectorized group-by and returns the
+    encoded result. Results are cached per dataset version, so repeated
+    aggregations are only computed once per sync.
+
+    Args:
+        category (str): Name of the data category.
+        media_type (str): "text/csv", "application/json" or
+            "application/x-ndjson".
+        group_by (List[str]): Columns to group by, given as table columns
+            (e.g. "Países") or schema field names (e.g. "pais"). If empty,
+            a single row of totals is returned.
+        metrics (List[str]): Aggregations as "<function>:<column>", where
+            function is one of sum, mean, min, max or count
+            (e.g. "sum:Quantidade (Kg)").
+        year (int, optional): Year to filter the data by. Takes precedence
+            over year_from and year_to.
+        year_from (int, optional): First year of the range to aggregate.
+        year_to (int, optional): Last year of the range to aggregate.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
 
-    return paginated_df.to_csv(index=False)
+    Returns:
+        bytes: The encoded aggregation, one record per group.
 
+    Raises:
+        InvalidQueryException: If a column or function is not supported.
+    """
+    dataset = _get_dataset(category, snapshot)
+    df = dataset.df
 
-def get_json(
+    if year is not None:
+        year_from = year_to = year
+    keys = [_resolve_column(category, df, name) for name in group_by]
+    aggregations = {}
+    for metric in metrics:
+        function, _, name = metric.partition(":")
+        if function not in __aggregations:
+            raise InvalidQueryException(
+                f"Unsupported aggregation '{function}'. "
+                f"Use one of: {', '.join(__aggregations)}."
+            )
+        column = _resolve_column(category, df, name)
+        if function != "count" and not pd.api.types.is_numeric_dtype(
+            df[column]
+        ):
+            raise InvalidQueryException(f"Column '{column}' is not numeric.")
+        aggregations[f"{function}:{column}"] = (column, function)
+    if not aggregations:
+        raise InvalidQueryException("At least one metric is required.")
+
+    key = ("aggregate", media_type, tuple(keys), tuple(aggregations))
+    key += (year_from, year_to)
+    body = response_cache.get(category, key, dataset.version)
+    if body is None:
+        rows = dataset.rows(year_from, year_to)
+        if keys:
+            result = (
+                rows.groupby(keys, sort=True, dropna=False)
+                .agg(**aggregations)
+                .reset_index()
+            )
+        else:
+            result = pd.DataFrame(
+                {
+                    name: [rows[column].agg(function)]
+                    for name, (column, function) in aggregations.items()
+                }
+            )
+        # Aggregates of empty selections (e.g. a mean) are missing values,
+        #   which are encoded as null.
+        result = result.astype(object).where(result.notna(), None)
+        body = serializers.encode(result, media_type)
+        response_cache.put(category, key, dataset.version, body)
+    return body
+
+
+def stream(
     category: str,
+    media_type: str,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     year: Optional[int] = None,
-) -> list[dict]:
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    dimensions: Optional[Dict[str, List[str]]] = None,
+    snapshot: Optional[str] = None,
+) -> Iterator[str]:
     """
-    Reads the cached JSON file for the given category and returns
-    its paginated content as a list of dictionaries.
+    Returns an iterator that encodes the selected rows of the cached table
+    chunk by chunk, keeping memory usage flat for full-table downloads.
 
-    If offset and limit are not provided, returns the entire dataset.
+    The table is resolved before the iterator is returned, so lookup errors
+    are raised here rather than while the response is being sent. The
+    iterator keeps a reference to that table version until it finishes.
 
     Args:
         category (str): Name of the data category.
-        offset (int, optional): Number of items to skip. Default is 0.
+        media_type (str): "text/csv", "application/json" or
+            "application/x-ndjson".
+        offset (int, optional): Number of items to skip.
         limit (int, optional): Maximum number of items to return.
-            Default is 100.
-        year (int, optional): Year to filter the data by.
+        year (int, optional): Year to filter the data by. Takes precedence
+            over year_from and year_to.
+        year_from (int, optional): First year of the range to return.
+        year_to (int, optional): Last year of the range to return.
+        fields (List[str], optional): Columns to return. All columns if
+            omitted.
+        dimensions (Dict[str, List[str]], optional): Accepted values of
+            dimension fields.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
 
     Returns:
-        list[dict]: Paginated JSON data or full dataset if no pagination
-            is requested.
+        Iterator[str]: Encoded chunks of the response body.
+
+    Raises:
+        InvalidQueryException: If a field or dimension is not defined for
+            the category.
+    """
+    encoder = serializers.ENCODERS[media_type]
+    dataset = _get_dataset(category, snapshot)
+    df = _select_rows(
+        dataset,
+        offset,
+        limit,
+        year,
+        year_from,
+        year_to,
+        _resolve_fields(category, dataset, fields),
+        _resolve_dimensions(category, dataset, dimensions),
+    )
+    return encoder(df, settings.STREAM_CHUNK_ROWS)
+
+
+def pin_snapshot(category: str) -> str:
+    """
+    Resolves the version of the table currently published for a category.
+
+    Passing the result to the read functions keeps every read of a request
+    on the same version, even if a sync publishes a new one meanwhile.
+
+    Args:
+        category (str): Name of the data category.
+
+    Returns:
+        str: Folder holding the files of the pinned version.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    _get_spec(category)
+    return snapshot_store.current_folder(
+        settings.LOCAL_CACHE_FOLDER, f"table_{category}"
+    )
+
+
+def get_artifact(
+    category: str,
+    media_type: str,
+    accept_encoding: str,
+    snapshot: Optional[str] = None,
+) -> Optional[Tuple[str, str]]:
     """
-    _get_category_class(category)
+    Returns the precompressed full-table download of a category that the
+    client can decode, if one was written for the current snapshot.
+
+    Args:
+        category (str): Name of the data category.
+        media_type (str): Media type of the response.
+        accept_encoding (str): Accept-Encoding header of the request.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
 
-    filepath = os.path.join(
-        settings.LOCAL_CACHE_FOLDER, f"table_{category}.json"
+    Returns:
+        Optional[Tuple[str, str]]: Path and content coding of the artifact,
+            or None if the table must be encoded on the fly.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    if snapshot is None:
+        snapshot = pin_snapshot(category)
+    return artifacts.find_artifact(
+        snapshot,
+        f"table_{category}",
+        media_type,
+        accept_encoding,
     )
-    df = pd.read_json(filepath)
 
+
+def get_dataset_version(
+    category: str, snapshot: Optional[str] = None
+) -> Tuple[str, datetime]:
+    """
+    Returns the version of the table currently cached on disk for the given
+    category, without loading it.
+
+    Args:
+        category (str): Name of the data category.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
+
+    Returns:
+        Tuple[str, datetime]: Version identifier of the table and the time
+            it was written by the last sync.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    filepath, _ = _resolve_table(category, snapshot)
+    return file_version(filepath)
+
+
+def warm_cache(category: str):
+    """
+    Loads the published table of a category into the in-memory cache, if
+    it is not there yet, so the first request after a sync does not pay
+    for reading it.
+
+    Args:
+        category (str): Name of the data category.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    _get_dataset(category)
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns the hit/miss counters of the in-memory dataset cache.
+
+    Returns:
+        dict: Cache counters (hits, misses, reloads and entries).
+    """
+    return dataset_cache.stats()
+
+
+def get_response_cache_stats() -> dict:
+    """
+    Returns the counters of the serialized response cache.
+
+    Returns:
+        dict: Hits, misses, hit ratio, evictions, invalidations and size.
+    """
+    return response_cache.stats()
+
+
+def _select_rows(
+    dataset: Dataset,
+    offset: Optional[int],
+    limit: Optional[int],
+    year: Optional[int],
+    year_from: Optional[int],
+    year_to: Optional[int],
+    columns: Optional[Tuple[str, ...]] = None,
+    filters: Optional[Dict[str, List[str]]] = None,
+) -> pd.DataFrame:
+    """
+    Resolves the filters and pagination of a request to rows of the cached
+    table, using its year and value indexes instead of scanning every row.
+
+    Returns:
+        pd.DataFrame: The selected rows.
+    """
     if year is not None:
-        df[__year_filter] = df[__year_filter].astype(int)
-        df = df[df[__year_filter] == year]
+        year_from = year_to = year
 
-    if offset is None and limit is None:
-        paginated_df = df
-    else:
-        paginated_offset = offset if offset is not None else 0
-        paginated_limit = limit if limit is not None else 100
-        paginated_df = df.iloc[
-            paginated_offset : paginated_offset + paginated_limit
-        ]
+    rows = dataset.select(year_from, year_to, filters)
+    if offset is not None or limit is not None:
+        offset = offset if offset is not None else 0
+        limit = limit if limit is not None else 100
+        rows = rows[offset : offset + limit]
+    return dataset.take(rows, columns)
+
+
+def _resolve_fields(
+    category: str, dataset: Dataset, fields: Optional[List[str]]
+) -> Optional[Tuple[str, ...]]:
+    """
+    Resolves a column projection to table columns, without duplicates.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The columns, in the requested order, or
+            None if every column is returned.
+
+    Raises:
+        InvalidQueryException: If a column is not defined for the category.
+    """
+    if not fields:
+        return None
+    columns = [_resolve_column(category, dataset.df, name) for name in fields]
+    return tuple(dict.fromkeys(columns))
+
+
+def _resolve_dimensions(
+    category: str,
+    dataset: Dataset,
+    dimensions: Optional[Dict[str, List[str]]],
+) -> Dict[str, List[str]]:
+    """
+    Resolves dimension filters, keyed by schema field name, to the indexed
+    columns of the table.
+
+    Returns:
+        Dict[str, List[str]]: Sorted accepted values of each filtered
+            column.
+
+    Raises:
+        InvalidQueryException: If a dimension is not defined for the
+            category.
+    """
+    columns = get_dimension_columns(category)
+    filters = {}
+    for name, values in (dimensions or {}).items():
+        if not values:
+            continue
+        column = columns.get(name)
+        if column not in dataset.value_indexes:
+            raise InvalidQueryException(
+                f"Category '{category}' cannot be filtered by '{name}'."
+            )
+        filters[column] = sorted(set(values))
+    return filters
+
+
+def _filters_key(filters: Dict[str, List[str]]) -> tuple:
+    """
+    Returns a hashable form of resolved dimension filters.
+    """
+    return tuple(
+        (column, tuple(filters[column])) for column in sorted(filters)
+    )
+
+
+def _resolve_column(category: str, df: pd.DataFrame, name: str) -> str:
+    """
+    Resolves a column given by its table name or by its schema field name.
+
+    Raises:
+        InvalidQueryException: If the table has no such column.
+    """
+    name = name.strip()
+    if name in df.columns:
+        return name
+    column = get_columns(category).get(name)
+    if column is None or column not in df.columns:
+        raise InvalidQueryException(f"Unknown column '{name}'.")
+    return column
+
+
+def _make_cursor(dataset: Dataset, position: int, query: list) -> str:
+    """
+    Builds the cursor of the page starting at the given row.
+
+    Besides the row position, the cursor records the year and dimension
+    values of the previous row, so the position can be recovered if the
+    table is replaced by a sync before the cursor is used. The dimension
+    values may repeat within a year, so the cursor also records which of
+    the rows sharing them was the previous one, and how many there were.
+    """
+    year = int(dataset.df[YEAR_COLUMN].iat[position - 1])
+    year_start, year_stop = dataset.year_index.slice(year, year)
+    identity = list(get_dimension_columns(query[0]).values())
+    identity_values = list(dataset.df.iloc[position - 1][identity])
+    matches = _identity_matches(
+        dataset, year_start, year_stop, identity, identity_values
+    )
+    # Rows with missing dimension values match nothing: they are resumed
+    #   by their offset within the year
+    row = position - 1 - year_start
+    occurrence = matches.index(row) if row in matches else 0
+
+    return encode_cursor(
+        {
+            "v": dataset.version,
+            "p": position,
+            "q": query,
+            "y": year,
+            "o": position - year_start,
+            "k": identity_values,
+            "n": occurrence,
+            "c": len(matches),
+        }
+    )
+
+
+def _resume_position(dataset: Dataset, payload: dict, query: list) -> int:
+    """
+    Returns the row where the page following a cursor starts.
+
+    Raises:
+        InvalidQueryException: If the cursor is malformed or belongs to
+            another query, or if the table was replaced and the previous
+            row can no longer be told apart from rows sharing its
+            dimension values.
+    """
+    try:
+        version, position = payload["v"], int(payload["p"])
+        year, year_offset = int(payload["y"]), int(payload["o"])
+        identity_values = list(payload["k"])
+        occurrence, occurrences = int(payload["n"]), int(payload["c"])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidQueryException("Malformed pagination cursor.")
+    if payload.get("q") != query:
+        raise InvalidQueryException(
+            "Pagination cursor does not match the query filters."
+        )
+
+    if version == dataset.version:
+        return position
+
+    # The table was replaced since the cursor was issued: find the last
+    #   row returned within its year and continue right after it.
+    year_start, year_stop = dataset.year_index.slice(year, year)
+    identity = list(get_dimension_columns(query[0]).values())
+    if year_start == year_stop:
+        # The whole year is gone: continue with the next year present
+        later_start, later_stop = dataset.year_index.slice(year + 1, None)
+        return later_start if later_start < later_stop else len(dataset.df)
+
+    matches = _identity_matches(
+        dataset, year_start, year_stop, identity, identity_values
+    )
+    if not matches:
+        return min(year_start + year_offset, year_stop)
+    if len(matches) != occurrences or not 0 <= occurrence < occurrences:
+        # Rows sharing the dimension values were added or removed: the
+        #   previous row cannot be told apart from them
+        raise InvalidQueryException(
+            "Pagination cursor is ambiguous after the data was updated; "
+            "restart from the first page."
+        )
+    return year_start + matches[occurrence] + 1
+
+
+def _identity_matches(
+    dataset: Dataset,
+    year_start: int,
+    year_stop: int,
+    identity: List[str],
+    identity_values: list,
+) -> List[int]:
+    """
+    Returns the offsets, within the rows of a year, of the rows holding
+    the given dimension values.
+    """
+    rows = dataset.df.iloc[year_start:year_stop][identity]
+    matches = (rows == identity_values).all(axis=1).to_numpy().nonzero()[0]
+    return matches.tolist()
+
+
+def _get_dataset(category: str, snapshot: Optional[str] = None) -> Dataset:
+    """
+    Returns the cached table for the given category, reading it from the
+    local cache folder only if it is not in memory or changed on disk.
 
-    return paginated_df.to_dict(orient="records")
+    Args:
+        category (str): Name of the data category.
+        snapshot (str, optional): Folder returned by `pin_snapshot`. The
+            currently published table if omitted.
+
+    Returns:
+        Dataset: The in-memory table. Its DataFrame must not be modified.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    filepath, loader = _resolve_table(category, snapshot)
+    index_columns = get_dimension_columns(category).values()
+    return dataset_cache.get(category, filepath, loader, index_columns)
+
+
+def _resolve_table(
+    category: str, snapshot: Optional[str] = None
+) -> Tuple[str, Callable[[str], pd.DataFrame]]:
+    """
+    Locates the file backing a category table in a published version.
+
+    The columnar snapshot written by the last sync is used when present;
+    caches written before snapshots existed fall back to the CSV file.
+
+    Returns:
+        Tuple[str, Callable[[str], pd.DataFrame]]: Path of the file and the
+            function used to load it.
+
+    Raises:
+        ScraperNotFoundException: If the category is not supported.
+    """
+    if snapshot is None:
+        snapshot = pin_snapshot(category)
+
+    file_name = f"table_{category}"
+    filepath = snapshot_path(snapshot, file_name)
+    if os.path.exists(filepath):
+        return filepath, read_snapshot
+
+    filepath = os.path.join(snapshot, f"{file_name}.csv")
+    return filepath, _read_csv
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    """
+    Reads a table cached as CSV, with the same column types as a snapshot.
+    """
+    return to_typed(pd.read_csv(path, dtype={YEAR_COLUMN: int}))
 
 
-def _get_category_class(category: str):
+def _get_spec(category: str) -> ScraperSpec:
     """
-    Retrieves the scraper class associated with the given category.
+    Retrieves the scraper spec associated with the given category.
 
     Args:
         category (str): Case-insensitive category name.
 
     Returns:
-        Instance of the corresponding scraper class.
+        ScraperSpec: Description of how the category is scraped.
 
     Raises:
         ScraperNotFoundException: If the category is not supported.
     """
-    scraper_class = __scrapers_registry.get(category.lower())
-    if not scraper_class:
+    spec = scraper_specs.get(category.lower())
+    if not spec:
         raise ScraperNotFoundException(
             f"Category '{category.lower()}' is not supported."
         )
-    return scraper_class()
+    return spec
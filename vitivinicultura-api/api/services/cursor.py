@@ -0,0 +1,51 @@
+"""
+Opaque pagination cursors for the category endpoints.
+
+A cursor is a URL-safe base64 encoding of a small JSON payload. Clients must
+treat it as an opaque token and only pass it back as received.
+"""
+
+import base64
+import binascii
+import json
+
+from api.exceptions.invalid_query_exception import InvalidQueryException
+
+
+def encode_cursor(payload: dict) -> str:
+    """
+    Encodes a cursor payload as an opaque token.
+
+    Args:
+        payload (dict): JSON-serializable cursor state.
+
+    Returns:
+        str: URL-safe token, without base64 padding.
+    """
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    token = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+    return token.rstrip("=")
+
+
+def decode_cursor(token: str) -> dict:
+    """
+    Decodes a token produced by `encode_cursor`.
+
+    Args:
+        token (str): The cursor received from the client.
+
+    Returns:
+        dict: The cursor payload.
+
+    Raises:
+        InvalidQueryException: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeError, binascii.Error, ValueError):
+        raise InvalidQueryException("Malformed pagination cursor.")
+
+    if not isinstance(payload, dict):
+        raise InvalidQueryException("Malformed pagination cursor.")
+    return payload
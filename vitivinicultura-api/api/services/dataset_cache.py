@@ -0,0 +1,365 @@
+"""
+In-process cache for the category tables stored in the local cache folder.
+
+Each table is parsed once per process and kept in memory. Before serving a
+cached table, the file it was read from is checked with a cheap `os.stat`;
+if its modification time or size changed (e.g. after a sync), the table is
+reloaded.
+
+Tables are kept ordered by year and indexed by it, so that year filters and
+pagination resolve to a contiguous slice of rows instead of a full scan.
+Dimension columns (country, product, ...) get a value index built at load
+time, so equality filters on them are lookups instead of boolean masks.
+"""
+
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Column every category table is indexed by
+YEAR_COLUMN = "ano"
+
+
+class YearIndex:
+    """
+    Maps each year of a table sorted by year to the contiguous range of rows
+    holding it.
+
+    Attributes:
+        years (list[int]): Years present in the table, in ascending order.
+    """
+
+    def __init__(self, years: pd.Series):
+        self.years = []
+        self._starts = []
+        self._stops = []
+
+        # The scrapers fetch one year at a time, so each year is already a
+        # single run of rows: only the boundaries need to be recorded.
+        values = years.to_numpy()
+        boundaries = (values[1:] != values[:-1]).nonzero()[0] + 1
+        starts = [0, *boundaries.tolist()]
+        stops = [*boundaries.tolist(), len(values)]
+        for start, stop in zip(starts, stops):
+            if start == stop:
+                continue
+            self.years.append(int(values[start]))
+            self._starts.append(start)
+            self._stops.append(stop)
+
+    def slice(
+        self, year_from: Optional[int] = None, year_to: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Returns the range of rows holding the given years.
+
+        Args:
+            year_from (int, optional): First year to include. Unbounded
+                if None.
+            year_to (int, optional): Last year to include. Unbounded
+                if None.
+
+        Returns:
+            Tuple[int, int]: Start (inclusive) and stop (exclusive) row
+                positions. Both are equal if no row matches.
+        """
+        lo = 0 if year_from is None else bisect_left(self.years, year_from)
+        hi = (
+            len(self.years)
+            if year_to is None
+            else bisect_right(self.years, year_to)
+        )
+        if lo >= hi:
+            return 0, 0
+        return self._starts[lo], self._stops[hi - 1]
+
+
+class ValueIndex:
+    """
+    Maps each distinct value of a column to the positions of the rows
+    holding it, in ascending order.
+
+    Attributes:
+        values (int): Number of distinct values in the column.
+    """
+
+    def __init__(self, column: pd.Series):
+        self._positions: Dict[object, np.ndarray] = column.groupby(
+            column, sort=False
+        ).indices
+        self.values = len(self._positions)
+
+    def lookup(self, values: Sequence) -> np.ndarray:
+        """
+        Returns the rows holding any of the given values.
+
+        Args:
+            values (Sequence): Values to match (an IN filter, or an
+                equality filter if there is a single value).
+
+        Returns:
+            np.ndarray: Sorted row positions. Empty if no row matches.
+        """
+        matches = [
+            self._positions[value]
+            for value in values
+            if value in self._positions
+        ]
+        if not matches:
+            return np.empty(0, dtype=np.intp)
+        if len(matches) == 1:
+            return matches[0]
+        # Each row holds a single value, so the matches never overlap
+        return np.sort(np.concatenate(matches), kind="stable")
+
+
+class Dataset:
+    """
+    An in-memory copy of a cached table.
+
+    The DataFrame must be treated as read-only, since the same instance is
+    shared by every request served from this version of the file.
+
+    Attributes:
+        df (pd.DataFrame): The parsed table, ordered by year.
+        path (str): Path of the file the table was read from.
+        version (str): Identifier of the file version (mtime and size).
+        loaded_at (datetime): When the table was loaded into memory.
+        year_index (YearIndex): Row ranges of each year in the table.
+        value_indexes (Dict[str, ValueIndex]): Value index of each indexed
+            column.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        path: str,
+        version: str,
+        index_columns: Iterable[str] = (),
+    ):
+        if not df[YEAR_COLUMN].is_monotonic_increasing:
+            # A stable sort keeps the original order of rows within a year
+            df = df.sort_values(YEAR_COLUMN, kind="stable", ignore_index=True)
+
+        self.df = df
+        self.path = path
+        self.version = version
+        self.loaded_at = datetime.now(timezone.utc)
+        self.year_index = YearIndex(df[YEAR_COLUMN])
+        self.value_indexes = {
+            column: ValueIndex(df[column])
+            for column in index_columns
+            if column in df.columns
+        }
+
+    def select(
+        self,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        filters: Optional[Mapping[str, Sequence]] = None,
+    ) -> Sequence[int]:
+        """
+        Returns the positions of the rows within a year range that match
+        the given filters.
+
+        Args:
+            year_from (int, optional): First year to include.
+            year_to (int, optional): Last year to include.
+            filters (Mapping[str, Sequence], optional): Accepted values of
+                indexed columns. Rows must hold one of the values of every
+                column.
+
+        Returns:
+            Sequence[int]: Sorted row positions: a range if there are no
+                filters, since a year range is a contiguous slice.
+
+        Raises:
+            KeyError: If a filtered column is not indexed.
+        """
+        start, stop = self.year_index.slice(year_from, year_to)
+        if not filters:
+            return range(start, stop)
+
+        matches = []
+        for column, values in filters.items():
+            positions = self.value_indexes[column].lookup(values)
+            lo, hi = positions.searchsorted([start, stop])
+            matches.append(positions[lo:hi])
+
+        # Intersecting the smallest matches first keeps every step small
+        matches.sort(key=len)
+        selection = matches[0]
+        for positions in matches[1:]:
+            selection = np.intersect1d(
+                selection, positions, assume_unique=True
+            )
+        return selection
+
+    def take(
+        self, rows: Sequence[int], columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Returns the given rows of the cached table, optionally restricted to
+        some of its columns.
+
+        Args:
+            rows (Sequence[int]): Row positions, as returned by `select`.
+            columns (Sequence[str], optional): Columns to return, in order.
+                All columns if None.
+
+        Returns:
+            pd.DataFrame: The rows. Must not be modified.
+        """
+        if isinstance(rows, range):
+            df = self.df.iloc[rows.start : rows.stop]
+        else:
+            df = self.df.iloc[rows]
+        return df if columns is None else df[list(columns)]
+
+    def rows(
+        self,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the rows within a year range, optionally paginated, as a
+        slice of the cached table.
+
+        Args:
+            year_from (int, optional): First year to include.
+            year_to (int, optional): Last year to include.
+            offset (int, optional): Number of rows to skip within the range.
+            limit (int, optional): Maximum number of rows to return.
+
+        Returns:
+            pd.DataFrame: The selected rows. Must not be modified.
+        """
+        start, stop = self.year_index.slice(year_from, year_to)
+        if offset is not None:
+            start = min(start + offset, stop)
+        if limit is not None:
+            stop = min(start + limit, stop)
+        return self.df.iloc[start:stop]
+
+
+class DatasetCache:
+    """
+    Thread-safe cache of `Dataset` objects keyed by table name.
+
+    Attributes:
+        hits (int): Lookups served from memory.
+        misses (int): Lookups that had to read the file.
+        reloads (int): Misses caused by a file changing on disk.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._entries: Dict[str, Dataset] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def get(
+        self,
+        key: str,
+        path: str,
+        loader: Callable[[str], pd.DataFrame],
+        index_columns: Iterable[str] = (),
+    ) -> Dataset:
+        """
+        Returns the cached table for the given key, loading it from the given
+        file if it is not cached yet, or if it was cached from another file or
+        from an older version of the same file.
+
+        Args:
+            key (str): Name the table is cached under (e.g. the category).
+            path (str): Path of the file currently backing the table.
+            loader (Callable[[str], pd.DataFrame]): Function used to parse
+                the file when it is not cached.
+            index_columns (Iterable[str], optional): Columns to build value
+                indexes for when the table is loaded.
+
+        Returns:
+            Dataset: The cached table.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        version = file_version(path)[0]
+
+        with self._lock:
+            dataset = self._entries.get(key)
+            if self._is_current(dataset, path, version):
+                self.hits += 1
+                return dataset
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Only one thread parses a given table; the others wait for it and
+        # then reuse the freshly loaded copy.
+        with load_lock:
+            version = file_version(path)[0]
+            with self._lock:
+                dataset = self._entries.get(key)
+                if self._is_current(dataset, path, version):
+                    self.hits += 1
+                    return dataset
+
+            loaded = Dataset(loader(path), path, version, index_columns)
+
+            with self._lock:
+                self.misses += 1
+                if dataset is not None:
+                    self.reloads += 1
+                self._entries[key] = loaded
+            return loaded
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Hits, misses, reloads and number of cached tables.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "entries": len(self._entries),
+            }
+
+    @staticmethod
+    def _is_current(dataset: Optional[Dataset], path: str, version: str):
+        if dataset is None:
+            return False
+        return dataset.path == path and dataset.version == version
+
+
+def file_version(path: str) -> Tuple[str, datetime]:
+    """
+    Identifies the current version of a file with a single `os.stat`.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        Tuple[str, datetime]: Version identifier (mtime and size) and the
+            modification time of the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(path)
+    modified_at = datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+    return f"{stat.st_mtime_ns}-{stat.st_size}", modified_at
+
+
+dataset_cache = DatasetCache()
@@ -0,0 +1,145 @@
+"""
+Leases electing a single process for a task across the API workers.
+
+When uvicorn runs several workers, each one is a separate process with its
+own scheduler and sync jobs. Tasks that must run in one process at a time
+(the periodic sync, the sync of a given category) are guarded by a lease
+stored in the application database, which every worker shares:
+
+- a lease is acquired by inserting its row, or by taking over a row whose
+  holder let it expire, in a single atomic statement;
+- its holder renews it before it expires (every SYNC_LEASE_TTL / 3
+  seconds), and releases it when done;
+- if the holder dies, the lease expires after SYNC_LEASE_TTL seconds and
+  another worker takes over.
+
+The lease statements run on a thread of their own: the default executor
+of the event loop may be busy with the sync scrapes, and a renewal
+delayed past the TTL would hand the lease to another worker mid-sync.
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from api.core.config import settings
+from database.db import SessionLocal
+from database.models import SyncLeaseDB
+
+# Identifies this process among the workers sharing the database
+PROCESS_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Runs the lease statements, apart from the executor running the syncs
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lease")
+
+
+class Lease:
+    """
+    A named, expiring lease held by at most one process.
+
+    Attributes:
+        name (str): Name of the leased task.
+        holder (str): Identifier of this holder.
+        ttl (float): Seconds the lease lasts unless renewed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        holder: Optional[str] = None,
+        ttl: Optional[float] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.name = name
+        self.holder = holder or PROCESS_ID
+        self.ttl = ttl if ttl is not None else settings.SYNC_LEASE_TTL
+        self._session_factory = session_factory
+
+    def acquire(self) -> bool:
+        """
+        Acquires the lease, or renews it if this holder already has it.
+
+        Returns:
+            bool: True if this holder has the lease for the next `ttl`
+                seconds, False if another live holder has it or the
+                database is unavailable.
+        """
+        now = time.time()
+        db = self._session_factory()
+        try:
+            taken = (
+                db.query(SyncLeaseDB)
+                .filter(
+                    SyncLeaseDB.name == self.name,
+                    or_(
+                        SyncLeaseDB.holder == self.holder,
+                        SyncLeaseDB.expires_at < now,
+                    ),
+                )
+                .update(
+                    {"holder": self.holder, "expires_at": now + self.ttl},
+                    synchronize_session=False,
+                )
+            )
+            if not taken:
+                db.add(
+                    SyncLeaseDB(
+                        name=self.name,
+                        holder=self.holder,
+                        expires_at=now + self.ttl,
+                    )
+                )
+            db.commit()
+            return True
+        except IntegrityError:
+            # Another live holder has the row
+            db.rollback()
+            return False
+        except OperationalError as e:
+            db.rollback()
+            print(f"[WARN] Could not acquire lease {self.name}: {e}")
+            return False
+        finally:
+            db.close()
+
+    async def acquire_async(self) -> bool:
+        """
+        Acquires or renews the lease from the event loop.
+
+        Returns:
+            bool: See `acquire`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, self.acquire)
+
+    def release(self):
+        """
+        Releases the lease if this holder has it.
+        """
+        db = self._session_factory()
+        try:
+            db.query(SyncLeaseDB).filter(
+                SyncLeaseDB.name == self.name,
+                SyncLeaseDB.holder == self.holder,
+            ).delete(synchronize_session=False)
+            db.commit()
+        except OperationalError as e:
+            db.rollback()
+            print(f"[WARN] Could not release lease {self.name}: {e}")
+        finally:
+            db.close()
+
+    async def release_async(self):
+        """
+        Releases the lease from the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_executor, self.release)
@@ -0,0 +1,156 @@
+"""
+In-process LRU cache of serialized category responses.
+
+Entries are keyed by the normalized query (category, media type, filters and
+pagination) and the version of the dataset they were encoded from. The cache
+is bounded by the total size of the cached bodies rather than by the number
+of entries.
+
+When a response encoded from a newer version of a category is stored, the
+entries of the versions it replaced are invalidated, except those of the
+version just before it: requests pinned to the snapshot that was current
+when they started keep their entries until the next sync.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from api.core.config import settings
+
+
+class ResponseCache:
+    """
+    Thread-safe, byte-bounded LRU cache of response bodies.
+
+    The versions of a category must sort in the order they were published,
+    as dataset versions do (they start with the modification time of the
+    file, in nanoseconds).
+
+    Attributes:
+        max_bytes (int): Budget for the total size of the cached bodies.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to serialize the response.
+        evictions (int): Entries dropped to stay within the byte budget.
+        invalidations (int): Entries dropped because a newer version of
+            their dataset was cached.
+    """
+
+    # Versions of a category whose entries are kept: the current one and
+    #   the one it replaced
+    KEPT_VERSIONS = 2
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[Tuple[str, str, Hashable], bytes] = (
+            OrderedDict()
+        )
+        self._versions: Dict[str, List[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, category: str, key: Hashable, version: str
+    ) -> Optional[bytes]:
+        """
+        Returns the cached body for a query on a version of a dataset.
+
+        Args:
+            category (str): Category the response belongs to.
+            key (Hashable): Normalized query parameters.
+            version (str): Version of the category dataset the request
+                reads from.
+
+        Returns:
+            Optional[bytes]: The cached body, or None on a miss.
+        """
+        entry = (category, version, key)
+        with self._lock:
+            body = self._entries.get(entry)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry)
+            self.hits += 1
+            return body
+
+    def put(self, category: str, key: Hashable, version: str, body: bytes):
+        """
+        Caches a body, evicting the least recently used entries as needed.
+        Bodies larger than the whole budget, or encoded from a version
+        older than the ones kept, are not cached.
+
+        Args:
+            category (str): Category the response belongs to.
+            key (Hashable): Normalized query parameters.
+            version (str): Version of the dataset the body was encoded from.
+            body (bytes): The serialized response.
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        entry = (category, version, key)
+        with self._lock:
+            if not self._keep_version(category, version):
+                return
+            previous = self._entries.pop(entry, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[entry] = body
+            self._size += len(body)
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Hits, misses, hit ratio, evictions, invalidations,
+                number of entries and their total size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _keep_version(self, category: str, version: str) -> bool:
+        # Must be called with the lock held
+        versions = self._versions.setdefault(category, [])
+        if version in versions:
+            return True
+
+        # A version older than the kept ones is dropped at once below
+        versions.append(version)
+        versions.sort()
+        stale = versions[: -self.KEPT_VERSIONS]
+        if stale:
+            del versions[: -self.KEPT_VERSIONS]
+            dropped = [
+                entry
+                for entry in self._entries
+                if entry[0] == category and entry[1] in stale
+            ]
+            for entry in dropped:
+                self._size -= len(self._entries.pop(entry))
+            self.invalidations += len(dropped)
+        return version in versions
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_BYTES)
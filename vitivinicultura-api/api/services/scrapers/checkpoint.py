@@ -0,0 +1,146 @@
+"""
+Checkpoints of the syncs in progress.
+
+A sync fetches hundreds of pages; if it is interrupted (a page keeps
+failing, the circuit opens, the process stops), the pages already loaded
+should not be fetched again. Each sync therefore journals the pages it
+completed, one line per page, next to the page archive:
+
+    <PAGE_ARCHIVE_FOLDER>/checkpoints/<table>.jsonl
+
+The first line records the years the sync fetches and when it started.
+When the next sync of the table selects the same years within
+SYNC_CHECKPOINT_MAX_AGE, it resumes: the completed pages are read back
+from the tables stored in the page archive, and only the others are
+requested. The journal is removed once the table is published.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import List, Optional, Set
+
+from api.core.config import settings
+
+# Folder of the page archive holding the checkpoints
+CHECKPOINTS_FOLDER = "checkpoints"
+
+
+class SyncCheckpoint:
+    """
+    Journal of the pages completed by a sync, resumed by the next sync of
+    the same years.
+
+    Attributes:
+        path (str): Path of the journal.
+        years (List[int]): Years fetched by the sync.
+        completed (Set[str]): URLs of the pages already loaded.
+        resumed (bool): Whether the journal of an interrupted sync was
+            resumed.
+    """
+
+    def __init__(
+        self, path: str, years: List[int], max_age: Optional[int] = None
+    ):
+        self.path = path
+        self.years = list(years)
+        self.completed: Set[str] = set()
+        self.resumed = False
+        self._lock = threading.Lock()
+
+        if max_age is None:
+            max_age = settings.SYNC_CHECKPOINT_MAX_AGE
+        if not self._resume(max_age):
+            self._start()
+
+    def is_completed(self, url: str) -> bool:
+        """
+        Checks whether a page was loaded before the sync was interrupted.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            bool: True if the page is journaled as completed.
+        """
+        return url in self.completed
+
+    def record(self, url: str):
+        """
+        Journals a page as completed. The line is flushed at once, so it
+        survives the process stopping.
+
+        Args:
+            url (str): URL of the page.
+        """
+        with self._lock:
+            if url in self.completed:
+                return
+            self.completed.add(url)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps({"url": url}) + "\n")
+
+    def clear(self):
+        """
+        Removes the journal once the sync completed.
+        """
+        with self._lock:
+            self.completed.clear()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _resume(self, max_age: int) -> bool:
+        """
+        Loads the journal of an interrupted sync of the same years, if it
+        is recent enough. Lines cut short by a crash are ignored.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        except OSError:
+            return False
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return False
+
+        started_at = header.get("started_at")
+        if header.get("years") != self.years or not started_at:
+            return False
+        if time.time() - started_at > max_age:
+            return False
+
+        for line in lines[1:]:
+            try:
+                self.completed.add(json.loads(line)["url"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.resumed = True
+        return True
+
+    def _start(self):
+        """
+        Starts a new journal, replacing any stale one.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        header = {"years": self.years, "started_at": time.time()}
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as file:
+            file.write(json.dumps(header) + "\n")
+        os.replace(f"{self.path}.tmp", self.path)
+
+
+def checkpoint_path(root: str, file_name: str) -> str:
+    """
+    Returns the path of the checkpoint journal of a table.
+
+    Args:
+        root (str): Folder of the page archive.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        str: Path of the journal.
+    """
+    return os.path.join(root, CHECKPOINTS_FOLDER, f"{file_name}.jsonl")
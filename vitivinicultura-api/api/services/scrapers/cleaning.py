@@ -0,0 +1,192 @@
+"""
+Cleaning stages shared by the scrapers.
+
+Every stage works on whole columns. The Embrapa tables repeat the same few
+hundred labels (countries, products, categories) across every year, so long
+columns are factorized first: text is repaired, numbers are parsed and
+category headers are detected once per distinct value, and the results are
+broadcast back to the rows. Category headers are then propagated down the
+table with a forward fill over their positions.
+
+The distinct values are few, so they are transformed with plain Python
+loops rather than pandas string methods, whose fixed cost per call
+dominates at these sizes. Short columns, e.g. the couple of years fetched
+by an incremental sync, skip the factorization (FACTORIZE_MIN_ROWS).
+
+The column stages (`fix_encoding`, `parse_numbers`, `categorize`) rewrite
+their columns in place. Rows are not filtered here: `product_mask` flags the
+product rows, and the scraper engine combines it with its other row filters
+(incomplete rows, `TOTAL` rows) into a single mask applied with one copy.
+"""
+
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_numeric_dtype
+
+# Embrapa writes "-" for quantities and values equal to zero
+ZERO = "-"
+# Label of the summary row closing every table
+TOTAL = "Total"
+# Columns shorter than this are transformed row by row: factorizing them
+#   costs more than it saves (see benchmarks/cleaning.py --years)
+FACTORIZE_MIN_ROWS = 1000
+
+
+def fix_encoding(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Repairs text decoded as Latin-1 while encoded as UTF-8 ("PaÃ­ses"
+        becomes "Países"). Values are converted to text first.
+
+    Args:
+        df (pd.DataFrame): The table to clean.
+        column (str): Text column to repair; skipped if missing.
+
+    Returns:
+        pd.DataFrame: The table, repaired in place.
+    """
+    if column not in df.columns:
+        return df
+    df[column] = _per_value(
+        df[column],
+        lambda values: _object_array(_repair(str(value)) for value in values),
+    )
+    return df
+
+
+def parse_numbers(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Converts Brazilian-formatted numbers ("1.234.567", "-" for zero) to
+        numeric columns. Cells that are not numbers become NaN.
+
+    Args:
+        df (pd.DataFrame): The table to clean.
+        columns (Iterable[str]): Columns to convert; missing columns and
+            columns that are already numeric are skipped.
+
+    Returns:
+        pd.DataFrame: The table, converted in place.
+    """
+    for column in columns:
+        if column not in df.columns or is_numeric_dtype(df[column]):
+            continue
+        if infer_dtype(df[column], skipna=True) == "integer":
+            # Typed pages concatenated with pages holding empty cells
+            df[column] = pd.to_numeric(df[column])
+        else:
+            df[column] = _per_value(df[column], _parse_numbers)
+    return df
+
+
+def categorize(
+    df: pd.DataFrame,
+    column: str,
+    target: str = "Categoria",
+    exclude: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Labels every row with the category header above it. Rows whose value
+        is uppercase are headers; their value is propagated down to the
+        rows that follow, until the next header.
+
+    Args:
+        df (pd.DataFrame): The table to label.
+        column (str): Column holding the products and their headers.
+        target (str): Column the category is written to.
+        exclude (Iterable[str]): Uppercase values that are products, not
+            headers.
+
+    Returns:
+        pd.DataFrame: The table, labeled in place. Rows before the first
+            header have no category (None).
+    """
+    excluded = {"NAN", *exclude}
+
+    def header(value) -> Optional[str]:
+        text = str(value).strip()
+        return text if text.isupper() and text not in excluded else None
+
+    def headers(values: np.ndarray) -> np.ndarray:
+        return _object_array(header(value) for value in values)
+
+    labels = _per_value(df[column], headers)
+    # Forward fill: every row takes the label of the last header above it
+    positions = np.where(pd.notna(labels), np.arange(len(labels)), -1)
+    np.maximum.accumulate(positions, out=positions)
+    categories = labels[positions]
+    categories[positions < 0] = None
+    df[target] = categories
+    return df
+
+
+def product_mask(column: pd.Series, keep: Iterable[str] = ()) -> np.ndarray:
+    """
+    Flags the product rows of a column: text values that are not category
+        headers.
+
+    Args:
+        column (pd.Series): Column holding the products and their headers.
+        keep (Iterable[str]): Uppercase values that are products.
+
+    Returns:
+        np.ndarray: Boolean mask of the product rows.
+    """
+    kept = set(keep)
+
+    def is_product(value) -> bool:
+        if not isinstance(value, str):
+            return False
+        text = value.strip()
+        return not text.isupper() or text in kept
+
+    def products(values: np.ndarray) -> np.ndarray:
+        return np.fromiter(
+            (is_product(value) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+
+    return _per_value(column, products)
+
+
+def _per_value(
+    column: pd.Series, transform: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """
+    Applies a transform to the distinct values of a column only, and
+        broadcasts the results back to its rows. Short columns are
+        transformed directly.
+    """
+    values = column.to_numpy(dtype=object)
+    if len(values) < FACTORIZE_MIN_ROWS:
+        return np.asarray(transform(values))
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.asarray(transform(uniques))[codes]
+
+
+def _parse_numbers(values: np.ndarray) -> np.ndarray:
+    text = [
+        ("0" if value == ZERO else str(value))
+        .replace(".", "")
+        .replace(ZERO, "")
+        .strip()
+        for value in values
+    ]
+    return pd.to_numeric(_object_array(text), errors="coerce")
+
+
+def _object_array(values: Iterable) -> np.ndarray:
+    # Built element-wise, so that values stay scalars even if they are
+    #   sequences themselves
+    items = list(values)
+    array = np.empty(len(items), dtype=object)
+    array[:] = items
+    return array
+
+
+def _repair(value: str) -> str:
+    try:
+        return value.encode("latin1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return value
@@ -0,0 +1,363 @@
+"""
+Scraper engine shared by every Embrapa category.
+
+The engine runs the same fetch-parse-clean path for every category,
+following its `ScraperSpec`:
+
+1. reads the years offered by Embrapa and selects those to fetch;
+2. fetches the page of every year (and sub-option) concurrently through
+   the page archive, retrying transient failures, and parses them in the
+   parse pool as they arrive. Completed pages are checkpointed, so a sync
+   interrupted midway resumes where it stopped;
+3. cleans the assembled table in a single pass: columns are repaired and
+   parsed in place, and every row filter (category headers, incomplete
+   rows, totals) is combined into one mask applied once;
+4. merges the fetched years into the cached table and publishes it as a
+   new version of the table.
+
+A sync can be cancelled through a `threading.Event`, e.g. when its worker
+loses the lease of the table: it is checked before every page request,
+as every page completes, and before the new version is written and
+published, so a cancelled sync stops writing before another worker takes
+over the table.
+"""
+
+import os
+import threading
+from typing import List, Optional
+
+import pandas as pd
+from bs4 import BeautifulSoup
+from requests import Response
+from requests.exceptions import RequestException
+
+from api.exceptions.circuit_open_exception import CircuitOpenException
+from api.exceptions.sync_cancelled_exception import SyncCancelledException
+
+from api.services import snapshot_store
+from api.services.artifacts import write_artifacts
+from api.services.dataset_cache import YEAR_COLUMN
+from api.services.scrapers.checkpoint import SyncCheckpoint, checkpoint_path
+from api.services.scrapers.cleaning import (
+    TOTAL,
+    categorize,
+    fix_encoding,
+    parse_numbers,
+    product_mask,
+)
+from api.services.scrapers.http_client import HttpClient, http_client
+from api.services.scrapers.incremental import (
+    full_sync_due,
+    merge_years,
+    read_cached_table,
+    years_to_fetch,
+)
+from api.services.scrapers.page_archive import FetchedPage, PageArchive
+from api.services.scrapers.page_fetcher import (
+    PageFetcher,
+    page_fetcher,
+    raise_if_cancelled,
+)
+from api.services.scrapers.specs import ScraperSpec
+from api.services.snapshot import (
+    digest_path,
+    table_digest,
+    to_typed,
+    write_snapshot,
+)
+
+# Column holding the sub-option label of each row
+SUBOPTION_COLUMN = "subopcao"
+# Column the category headers are propagated to
+CATEGORY_COLUMN = "Categoria"
+
+
+class ScraperEngine:
+    """
+    Scrapes, cleans and caches the table of a category.
+
+    Attributes:
+        spec (ScraperSpec): Description of the category.
+        client (HttpClient): Client used to request the pages.
+        fetcher (PageFetcher): Fetches the pages concurrently.
+        archive (PageArchive): Archive the pages are fetched through.
+        changed (bool): Whether the last sync published a new version of
+            the table; False if the table fetched was identical to the
+            published one.
+        pages_fetched (int): Pages fetched so far by the current or last
+            sync.
+        pages_resumed (int): Pages of the current or last sync read back
+            from the checkpoint of an interrupted sync.
+    """
+
+    def __init__(
+        self,
+        spec: ScraperSpec,
+        client: Optional[HttpClient] = None,
+        fetcher: Optional[PageFetcher] = None,
+        archive: Optional[PageArchive] = None,
+    ):
+        self.spec = spec
+        self.client = client or http_client
+        self.fetcher = fetcher or page_fetcher
+        self.archive = archive or PageArchive(client=self.client)
+        self.changed = False
+        self.pages_fetched = 0
+        self.pages_resumed = 0
+        self._lock = threading.Lock()
+
+    def sync(
+        self,
+        base_url: str,
+        file_path: str,
+        file_name: str,
+        full=False,
+        cancel: Optional[threading.Event] = None,
+    ) -> bool:
+        """
+        Fetches, cleans and saves the table of the category.
+
+        Args:
+            base_url (str): Base URL to scrape data from.
+            file_path (str): Directory path where files will be saved.
+            file_name (str): Name of the output files (without extension).
+            full (bool): Fetch every year instead of only the years missing
+                from the cached table plus the most recent ones. A sync is
+                always full once the last full sync of the table is older
+                than SYNC_FULL_INTERVAL.
+            cancel (threading.Event, optional): Stops the sync once set;
+                nothing is written or published afterwards.
+
+        Returns:
+            bool: True if sync succeeded and data was saved, False otherwise.
+        """
+        self.changed = False
+        self.pages_fetched = self.pages_resumed = 0
+        try:
+            available = self._get_years(base_url, cancel)
+            if not full and full_sync_due(file_path, file_name):
+                print("[SYNC] Full sync due, fetching every year.")
+                full = True
+            cached = None if full else read_cached_table(file_path, file_name)
+            years = years_to_fetch(available, cached)
+            if not years:
+                print("[SYNC] Cached table is up to date.")
+                return True
+
+            checkpoint = SyncCheckpoint(
+                checkpoint_path(self.archive.root, file_name), years
+            )
+            if checkpoint.resumed:
+                print(
+                    f"[SYNC] Resuming interrupted sync: "
+                    f"{len(checkpoint.completed)} pages already fetched."
+                )
+            df = self._fetch_table(base_url, years, checkpoint, cancel)
+            if df.empty:
+                return False
+
+            df = self._clean(df)
+            df = merge_years(cached, df, available)
+            self.changed = self._save_df(df, file_path, file_name, cancel)
+            checkpoint.clear()
+            if years == available:
+                snapshot_store.record_full_sync(file_path, file_name)
+            return True
+
+        except SyncCancelledException:
+            print("[SYNC] Sync cancelled, nothing was published.")
+            return False
+        except Exception as e:
+            print(f"[WARN] Scraper failed. Reason: {e}")
+            return False
+
+    def _get_years(
+        self, base_url: str, cancel: Optional[threading.Event] = None
+    ) -> List[int]:
+        """
+        Reads the range of years offered by Embrapa for the category.
+        """
+
+        def read(url: str) -> Response:
+            response = self.client.get(url)
+            response.raise_for_status()
+            return response
+
+        try:
+            response = self.fetcher.fetch(
+                f"{base_url}?opcao={self.spec.opcao}", read, cancel
+            )
+        except (RequestException, CircuitOpenException) as e:
+            print(f"[ERROR] Failed to connect to Embrapa: {e}")
+            raise
+
+        soup = BeautifulSoup(response.content, "html.parser")
+        select_years = soup.find("input", {"class": "text_pesq"})
+        return list(
+            range(int(select_years["min"]), int(select_years["max"]) + 1)
+        )
+
+    def _fetch_table(
+        self,
+        base_url: str,
+        years: List[int],
+        checkpoint: Optional[SyncCheckpoint] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> pd.DataFrame:
+        """
+        Fetches the data table of every year and sub-option, and stacks
+            them in year order. Pages completed before an interruption are
+            read back from the archive; the others are journaled in the
+            checkpoint as they complete.
+        """
+        spec = self.spec
+        if spec.suboptions:
+            pages = [
+                (year, suboption)
+                for year in years
+                for suboption in spec.suboptions
+            ]
+            urls = [
+                f"{base_url}?subopcao={suboption}&opcao={spec.opcao}"
+                f"&ano={year}"
+                for year, suboption in pages
+            ]
+        else:
+            pages = [(year, None) for year in years]
+            urls = [
+                f"{base_url}?ano={year}&opcao={spec.opcao}" for year in years
+            ]
+
+        tables = [None] * len(urls)
+        if checkpoint is not None:
+            for i, url in enumerate(urls):
+                if checkpoint.is_completed(url):
+                    tables[i] = self.archive.stored_table(url)
+        missing = [i for i, table in enumerate(tables) if table is None]
+        self.pages_resumed = len(urls) - len(missing)
+
+        def load(page: FetchedPage) -> pd.DataFrame:
+            table = self.archive.load(page)
+            raise_if_cancelled(cancel)
+            if checkpoint is not None:
+                checkpoint.record(page.url)
+            with self._lock:
+                self.pages_fetched += 1
+            return table
+
+        # Pages are fetched concurrently and returned in request order; each
+        #   is parsed in the parse pool while the next ones are downloaded
+        fetched = self.fetcher.fetch_all(
+            [urls[i] for i in missing], self.archive.fetch, load, cancel
+        )
+        for i, table in zip(missing, fetched):
+            tables[i] = table
+
+        for (year, suboption), table in zip(pages, tables):
+            table[YEAR_COLUMN] = year
+            if suboption is not None:
+                table[SUBOPTION_COLUMN] = spec.suboptions[suboption]
+        if not tables:
+            return pd.DataFrame()
+
+        df = pd.concat(tables, ignore_index=True)
+        dropped = [col for col in spec.dropped_columns if col in df.columns]
+        return df.drop(columns=dropped).rename(columns=spec.renamed_columns)
+
+    def _clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cleans the assembled table in a single pass.
+        """
+        spec = self.spec
+        label = spec.label_column
+
+        # Column stages rewrite their columns in place
+        fix_encoding(df, label)
+        parse_numbers(df, spec.numeric_columns)
+        if spec.categorized:
+            categorize(
+                df,
+                label,
+                target=CATEGORY_COLUMN,
+                exclude=spec.excluded_headers,
+            )
+
+        # Row filters are combined and applied with a single copy
+        keep = product_mask(df[label], spec.excluded_headers)
+        keep &= df.notna().all(axis=1).to_numpy()
+        keep &= df[label].to_numpy() != TOTAL
+        return df[keep].reset_index(drop=True)
+
+    def _save_df(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        file_name: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> bool:
+        """
+        Publishes the cleaned DataFrame as a new version of the table: the
+            columnar snapshot the API reads from, its digest and its
+            precompressed downloads. CSV and JSON responses are encoded
+            from the snapshot, so no text export is written.
+
+        Every file is written into the directory of the new version, which
+            is published once they are all complete, so readers never see
+            a partially written table. A table identical to the published
+            one is not published again, so the API keeps its caches.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be saved.
+            file_path (str): The path where the files will be saved.
+            file_name (str): The base name of the files to be saved.
+            cancel (threading.Event, optional): Cancels the sync; checked
+                before the version is written and before it is published.
+
+        Returns:
+            bool: True if a new version was published, False if the table
+                did not change.
+
+        Raises:
+            SyncCancelledException: If the sync was cancelled.
+        """
+        # Hashed as stored: column types depend on how the table was
+        #   assembled (e.g. empty cells make a full sync's numbers float)
+        df = to_typed(df)
+        digest = table_digest(df)
+        if _is_published(digest, file_path, file_name):
+            print("[SYNC] Table unchanged, keeping the published version.")
+            return False
+
+        raise_if_cancelled(cancel)
+        os.makedirs(file_path, exist_ok=True)
+        version, folder = snapshot_store.create_version(file_path, file_name)
+
+        try:
+            write_snapshot(df, folder, file_name)
+            with open(digest_path(folder, file_name), "w") as file:
+                file.write(digest)
+            write_artifacts(folder, file_name)
+            raise_if_cancelled(cancel)
+        except Exception:
+            snapshot_store.discard(file_path, file_name, version)
+            raise
+
+        snapshot_store.publish(file_path, file_name, version)
+        return True
+
+
+def _is_published(digest: str, file_path: str, file_name: str) -> bool:
+    """
+    Checks whether a table is identical to its published version, by
+    comparing their digests. Versions published without a digest are
+    considered different.
+    """
+    version = snapshot_store.current_version(file_path, file_name)
+    if version is None:
+        return False
+    folder = snapshot_store.version_folder(file_path, file_name, version)
+    try:
+        with open(digest_path(folder, file_name)) as file:
+            return file.read().strip() == digest
+    except OSError:
+        return False
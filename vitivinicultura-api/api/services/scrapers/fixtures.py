@@ -0,0 +1,250 @@
+"""
+Record/replay fixtures of the Embrapa pages, for offline scraper runs.
+
+In record mode, every page the scrapers fetch is captured into a single
+compressed fixture archive (a zip file). In replay mode, the pages are
+served from that archive instead of Embrapa, so full syncs run offline and
+deterministically, with timings comparable across versions of the code.
+
+The archive is append-only: each response is stored as two entries, its
+metadata (`<n>.json`) and its body (`<n>.body`), and a page recorded
+again is only appended if its content changed; the last recording of a
+page wins. Pages are keyed by the path and query of their URL, not its
+host, so an archive recorded from Embrapa can be replayed whatever
+EMBRAPA_URL points at.
+
+Both modes are transports of the scrapers' HTTP client, selected by
+SCRAPER_FIXTURE_MODE. Versions of the code without them can replay an
+archive through the stand-in server of benchmarks/replay_server.py.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+import zipfile
+from datetime import datetime, timezone
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Response headers stored with the pages
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Request headers stripped while recording, so every page is captured in
+#   full instead of as a 304 Not Modified
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+def fixture_key(url: str) -> str:
+    """
+    Returns the key a page is stored under in the fixture archive.
+
+    Args:
+        url (str): URL of the page.
+
+    Returns:
+        str: Path of the URL followed by its query parameters, sorted.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.path}?{query}" if query else parts.path
+
+
+class FixtureArchive:
+    """
+    Compressed archive of recorded Embrapa responses.
+
+    Attributes:
+        path (str): Path of the zip file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._index: Dict[str, dict] = {}
+        self._count = 0
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, url: str) -> Optional[Tuple[dict, bytes]]:
+        """
+        Looks up the last recording of a page.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            Optional[Tuple[dict, bytes]]: Metadata (status, headers) and
+                body of the recorded response, or None if the page was
+                never recorded.
+        """
+        metadata = self._index.get(fixture_key(url))
+        if metadata is None:
+            return None
+        with zipfile.ZipFile(self.path) as archive:
+            body = archive.read(metadata["entry"] + ".body")
+        return metadata, body
+
+    def record(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ):
+        """
+        Appends a response to the archive, unless the page is already
+        recorded with the same status and content.
+
+        Args:
+            url (str): URL of the page.
+            status (int): HTTP status of the response.
+            headers (Mapping[str, str]): Headers of the response; only
+                RECORDED_HEADERS are kept.
+            body (bytes): Decompressed body of the response.
+        """
+        key = fixture_key(url)
+        sha256 = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            stored = self._index.get(key, {})
+            unchanged = stored.get("sha256") == sha256
+            if unchanged and stored.get("status") == status:
+                return
+
+            entry = f"{self._count:06d}"
+            metadata = {
+                "entry": entry,
+                "key": key,
+                "url": url,
+                "status": status,
+                "headers": {
+                    name: headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in headers
+                },
+                "sha256": sha256,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            }
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with zipfile.ZipFile(
+                self.path, "a", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                archive.writestr(entry + ".body", body)
+                archive.writestr(entry + ".json", json.dumps(metadata))
+            self._index[key] = metadata
+            self._count += 1
+
+    def respond(
+        self, url: str, headers: Mapping[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answers a request for a page the way Embrapa answered it when it
+        was recorded, honoring conditional requests.
+
+        Args:
+            url (str): URL requested.
+            headers (Mapping[str, str]): Headers of the request.
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: Status, headers and body of
+                the response: the recorded page, a 304 if the validators
+                of the request match it, or a 404 if it was never
+                recorded.
+        """
+        found = self.lookup(url)
+        if found is None:
+            return 404, {}, f"No fixture for {fixture_key(url)}".encode()
+
+        metadata, body = found
+        response_headers = dict(metadata["headers"])
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if (etag and headers.get("If-None-Match") == etag) or (
+            last_modified and headers.get("If-Modified-Since") == last_modified
+        ):
+            return 304, response_headers, b""
+        response_headers["Content-Length"] = str(len(body))
+        return metadata["status"], response_headers, body
+
+    def _load_index(self):
+        """
+        Indexes the last recording of every page of an existing archive.
+        """
+        if not os.path.exists(self.path):
+            return
+        with zipfile.ZipFile(self.path) as archive:
+            for name in sorted(archive.namelist()):
+                if name.endswith(".json"):
+                    metadata = json.loads(archive.read(name))
+                    self._index[metadata["key"]] = metadata
+                    self._count += 1
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Transport requesting the pages from the network and recording the
+    successful responses into a fixture archive.
+
+    Attributes:
+        archive (FixtureArchive): Archive the responses are recorded into.
+    """
+
+    def __init__(self, archive: FixtureArchive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        for name in CONDITIONAL_HEADERS:
+            request.headers.pop(name, None)
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            self.archive.record(
+                request.url,
+                response.status_code,
+                response.headers,
+                response.content,
+            )
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport answering the requests from a fixture archive, without any
+    network access.
+
+    Attributes:
+        archive (FixtureArchive): Archive the responses are served from.
+    """
+
+    def __init__(self, archive: FixtureArchive):
+        super().__init__()
+        self.archive = archive
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        status, headers, body = self.archive.respond(
+            request.url, request.headers
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, "")
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers
+        )
+        return response
+
+    def close(self):
+        pass
@@ -0,0 +1,109 @@
+"""
+Pooled HTTP client shared by the scrapers.
+
+Every request to Embrapa goes through a single `requests.Session`, so the
+hundreds of pages fetched by a sync reuse a handful of keep-alive
+connections instead of opening one connection per page.
+
+With SCRAPER_FIXTURE_MODE set, the session records the pages it fetches
+into a fixture archive ("record"), or serves them from it without any
+network access ("replay"): see api/services/scrapers/fixtures.py
+"""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.core.config import settings
+from api.services.scrapers.fixtures import (
+    FixtureArchive,
+    RecordingAdapter,
+    ReplayAdapter,
+)
+
+# Modes of SCRAPER_FIXTURE_MODE
+FIXTURE_MODES = ("", "record", "replay")
+
+
+class HttpClient:
+    """
+    Thread-safe HTTP client with a bounded keep-alive connection pool.
+
+    Responses are requested compressed (gzip, deflate or brotli) and
+    decompressed transparently.
+
+    Attributes:
+        session (requests.Session): The pooled session.
+        timeout (tuple[float, float]): Connect and read timeouts, in
+            seconds, applied to every request.
+        fixtures (Optional[FixtureArchive]): Archive the pages are recorded
+            into or replayed from, if a fixture mode is set.
+
+    Raises:
+        ValueError: If the fixture mode is unknown.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        fixture_mode: Optional[str] = None,
+        fixture_path: Optional[str] = None,
+    ):
+        max_connections = max_connections or settings.SCRAPER_MAX_IN_FLIGHT
+        self.timeout = (
+            connect_timeout or settings.SCRAPER_CONNECT_TIMEOUT,
+            read_timeout or settings.SCRAPER_READ_TIMEOUT,
+        )
+
+        if fixture_mode is None:
+            fixture_mode = settings.SCRAPER_FIXTURE_MODE
+        if fixture_mode not in FIXTURE_MODES:
+            raise ValueError(f"Unknown scraper fixture mode: {fixture_mode}")
+        self.fixtures = None
+        if fixture_mode:
+            self.fixtures = FixtureArchive(
+                fixture_path or settings.SCRAPER_FIXTURE_PATH
+            )
+
+        # pool_block makes callers wait for a free connection instead of
+        #   opening extra ones that would be discarded afterwards.
+        pool = dict(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            pool_block=True,
+        )
+        if fixture_mode == "replay":
+            adapter = ReplayAdapter(self.fixtures)
+        elif fixture_mode == "record":
+            adapter = RecordingAdapter(self.fixtures, **pool)
+        else:
+            adapter = HTTPAdapter(**pool)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Sends a GET request through the shared pool.
+
+        Args:
+            url (str): URL to request.
+            headers (Dict[str, str], optional): Extra request headers, e.g.
+                conditional request validators.
+
+        Returns:
+            requests.Response: The response, whatever its status code.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or
+                times out.
+        """
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+
+http_client = HttpClient()
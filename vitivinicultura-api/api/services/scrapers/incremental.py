@@ -0,0 +1,135 @@
+"""
+Incremental sync helpers shared by the scrapers.
+
+Historical years of the Embrapa tables essentially never change. Instead of
+downloading every year on each sync, the scrapers read the years already
+present in the published snapshot and only fetch the years missing from it,
+plus a trailing window of recent years that may still be revised. The
+fetched years then replace their counterparts in the cached table.
+
+Older years can still be revised upstream now and then, so every sync
+fetches every year again once the last full sync of the table is older
+than SYNC_FULL_INTERVAL. The time of the last full sync is stored with
+the snapshots of the table, so restarts do not postpone it.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pandas as pd
+
+from api.core.config import settings
+from api.services.dataset_cache import YEAR_COLUMN
+from api.services.snapshot_store import current_folder, last_full_sync
+from api.services.snapshot import read_snapshot, snapshot_path
+
+
+def read_cached_table(
+    file_path: str, file_name: str
+) -> Optional[pd.DataFrame]:
+    """
+    Reads the snapshot of the version of a table currently published.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        Optional[pd.DataFrame]: The cached table, or None if there is no
+            snapshot (or it cannot be read) and a full sync is required.
+    """
+    path = snapshot_path(current_folder(file_path, file_name), file_name)
+    if not os.path.exists(path):
+        return None
+    try:
+        return read_snapshot(path)
+    except Exception as e:
+        print(f"[WARN] Could not read snapshot {path}: {e}")
+        return None
+
+
+def full_sync_due(
+    file_path: str, file_name: str, interval: Optional[int] = None
+) -> bool:
+    """
+    Checks whether the next sync of a table must fetch every year.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        interval (int, optional): Maximum age, in seconds, of the last full
+            sync. Defaults to SYNC_FULL_INTERVAL.
+
+    Returns:
+        bool: True if the table was never synced in full, or not within
+            the interval.
+    """
+    if interval is None:
+        interval = settings.SYNC_FULL_INTERVAL
+    synced_at = last_full_sync(file_path, file_name)
+    if synced_at is None:
+        return True
+    age = datetime.now(timezone.utc) - synced_at
+    return age.total_seconds() >= interval
+
+
+def years_to_fetch(
+    available: List[int],
+    cached: Optional[pd.DataFrame],
+    trailing_years: Optional[int] = None,
+) -> List[int]:
+    """
+    Selects the years a sync has to download.
+
+    Args:
+        available (List[int]): Years offered by Embrapa, in ascending order.
+        cached (Optional[pd.DataFrame]): Table from the previous sync, or
+            None to fetch every year.
+        trailing_years (int, optional): Number of most recent years always
+            fetched again. Defaults to SYNC_TRAILING_YEARS.
+
+    Returns:
+        List[int]: Years absent from the cached table, plus the trailing
+            window, in ascending order.
+    """
+    if cached is None:
+        return list(available)
+    if trailing_years is None:
+        trailing_years = settings.SYNC_TRAILING_YEARS
+
+    cached_years = set(cached[YEAR_COLUMN].unique().tolist())
+    recent = set(available[-trailing_years:]) if trailing_years > 0 else set()
+    return [
+        year
+        for year in available
+        if year not in cached_years or year in recent
+    ]
+
+
+def merge_years(
+    cached: Optional[pd.DataFrame],
+    fetched: pd.DataFrame,
+    available: List[int],
+) -> pd.DataFrame:
+    """
+    Replaces the fetched years in the cached table.
+
+    Args:
+        cached (Optional[pd.DataFrame]): Table from the previous sync, or
+            None if every year was fetched.
+        fetched (pd.DataFrame): Cleaned rows of the fetched years.
+        available (List[int]): Years offered by Embrapa; cached years no
+            longer offered are dropped, as a full sync would.
+
+    Returns:
+        pd.DataFrame: The merged table, ordered by year.
+    """
+    if cached is None:
+        return fetched
+
+    years = cached[YEAR_COLUMN]
+    refetched = years.isin(fetched[YEAR_COLUMN].unique())
+    kept = cached[years.isin(available) & ~refetched]
+    merged = pd.concat([kept, fetched], ignore_index=True)
+    return merged.sort_values(YEAR_COLUMN, kind="stable", ignore_index=True)
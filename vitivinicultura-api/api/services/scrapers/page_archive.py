@@ -0,0 +1,254 @@
+"""
+Archive of the raw Embrapa pages fetched by the scrapers.
+
+Each page is stored under its (opcao, subopcao, ano) key together with a
+SHA-256 hash of its content, the validators sent by the server (ETag and
+Last-Modified) and the table parsed from it:
+
+    <PAGE_ARCHIVE_FOLDER>/<opcao>/<subopcao>/<ano>.html.gz   raw page
+    <PAGE_ARCHIVE_FOLDER>/<opcao>/<subopcao>/<ano>.pkl       data table
+    <PAGE_ARCHIVE_FOLDER>/<opcao>/<subopcao>/<ano>.json      metadata
+
+When a page is fetched again, the request is made conditional on the stored
+validators. If the server answers `304 Not Modified`, or sends a page whose
+hash is unchanged, the stored table is reused instead of parsing the HTML
+again.
+
+Reading a page is split into `fetch`, which only requests it, and `load`,
+which parses it in the parse pool, so the scrapers can release their
+request slot before the page is parsed.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from api.core.config import settings
+from api.services.scrapers.http_client import HttpClient, http_client
+from api.services.scrapers.parse_pool import ParsePool, parse_pool
+
+# Identifies how stored tables were extracted; tables stored by another
+#   extractor are extracted again from their page.
+EXTRACTOR = "tb_dados/1"
+
+
+class PageArchive:
+    """
+    Fetches pages through the archive, reusing unchanged parsed tables.
+
+    Attributes:
+        root (str): Folder the pages are archived in.
+        client (HttpClient): Client used to request the pages.
+        parser (ParsePool): Pool extracting the data table of the pages.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        client: Optional[HttpClient] = None,
+        parser: Optional[ParsePool] = None,
+    ):
+        self.root = root or settings.PAGE_ARCHIVE_FOLDER
+        self.client = client or http_client
+        self.parser = parser or parse_pool
+
+    def fetch(self, url: str) -> "FetchedPage":
+        """
+        Requests a page, conditionally on its archived validators. This is
+            the network-bound half of reading a page.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            FetchedPage: The page, holding either its stored table, when it
+                is unchanged, or its content, to be parsed by `load`.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or
+                returns an error status.
+        """
+        key = page_key(url)
+        if key is None:
+            response = self.client.get(url)
+            response.raise_for_status()
+            return FetchedPage(url, content=response.content)
+
+        base = os.path.join(self.root, *key)
+        metadata = self._read_metadata(base)
+        stored = (
+            metadata is not None and metadata.get("extractor") == EXTRACTOR
+        )
+
+        headers = {}
+        if stored and metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if stored and metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+        response = self.client.get(url, headers=headers)
+        not_modified = response.status_code == 304 and stored
+        if not_modified:
+            table = self._read_table(base)
+            if table is not None:
+                return FetchedPage(url, base=base, table=table)
+            # The stored table is unusable: fetch the page in full
+            response = self.client.get(url)
+        response.raise_for_status()
+
+        content = response.content
+        page_metadata = {
+            "url": url,
+            "extractor": EXTRACTOR,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if stored and metadata.get("sha256") == page_metadata["sha256"]:
+            table = self._read_table(base)
+            if table is not None:
+                self._write_metadata(base, page_metadata)
+                return FetchedPage(url, base=base, table=table)
+        return FetchedPage(
+            url, base=base, content=content, metadata=page_metadata
+        )
+
+    def stored_table(self, url: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the table stored for a page by a previous fetch, without
+            requesting it.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            Optional[pd.DataFrame]: The stored table, or None if the page
+                is not archived or its table is unusable.
+        """
+        key = page_key(url)
+        if key is None:
+            return None
+        base = os.path.join(self.root, *key)
+        metadata = self._read_metadata(base)
+        if metadata is None or metadata.get("extractor") != EXTRACTOR:
+            return None
+        return self._read_table(base)
+
+    def load(self, page: "FetchedPage") -> pd.DataFrame:
+        """
+        Returns the data table of a fetched page, parsing and archiving it
+            unless the stored table was reused. This is the CPU-bound half
+            of reading a page.
+
+        Args:
+            page (FetchedPage): Page returned by `fetch`.
+
+        Returns:
+            pd.DataFrame: The table. It is a fresh copy the caller may
+                modify.
+
+        Raises:
+            ValueError: If the page has no data table.
+        """
+        if page.table is not None:
+            return page.table
+
+        table = self.parser.extract_table(page.content)
+        if page.base is not None:
+            self._write_page(page.base, page.content, table)
+            self._write_metadata(page.base, page.metadata)
+        return table
+
+    @staticmethod
+    def _read_metadata(base: str) -> Optional[dict]:
+        try:
+            with open(f"{base}.json", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_table(base: str) -> Optional[pd.DataFrame]:
+        try:
+            return pd.read_pickle(f"{base}.pkl")
+        except Exception:
+            return None
+
+    @staticmethod
+    def _write_page(base: str, content: bytes, table: pd.DataFrame):
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        with gzip.open(f"{base}.html.gz.tmp", "wb") as file:
+            file.write(content)
+        os.replace(f"{base}.html.gz.tmp", f"{base}.html.gz")
+        table.to_pickle(f"{base}.pkl.tmp", compression=None)
+        os.replace(f"{base}.pkl.tmp", f"{base}.pkl")
+
+    @staticmethod
+    def _write_metadata(base: str, metadata: dict):
+        # Written last: the metadata vouches for the stored page and table
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        with open(f"{base}.json.tmp", "w", encoding="utf-8") as file:
+            json.dump(metadata, file)
+        os.replace(f"{base}.json.tmp", f"{base}.json")
+
+
+class FetchedPage:
+    """
+    A page fetched through the archive, before its table is loaded.
+
+    Attributes:
+        url (str): URL of the page.
+        base (Optional[str]): Archive path of the page, without extension,
+            or None if the page is not archived.
+        content (Optional[bytes]): Raw HTML to parse, or None if the stored
+            table is reused.
+        table (Optional[pd.DataFrame]): Stored table reused for the page.
+        metadata (Optional[dict]): Metadata archived once the table parsed
+            from the content is stored.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        base: Optional[str] = None,
+        content: Optional[bytes] = None,
+        table: Optional[pd.DataFrame] = None,
+        metadata: Optional[dict] = None,
+    ):
+        self.url = url
+        self.base = base
+        self.content = content
+        self.table = table
+        self.metadata = metadata
+
+
+def page_key(url: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Returns the archive key of an Embrapa page.
+
+    Args:
+        url (str): URL of the page.
+
+    Returns:
+        Optional[Tuple[str, str, str]]: The opcao, subopcao ("-" for pages
+            without sub-options) and ano query parameters, or None if the
+            URL does not identify a yearly page.
+    """
+    query = parse_qs(urlsplit(url).query)
+    opcao, ano = query.get("opcao"), query.get("ano")
+    if not opcao or not ano:
+        return None
+    subopcao = query.get("subopcao", ["-"])[0]
+    key = (opcao[0], subopcao, ano[0])
+    # Keys become path components: never let them leave the archive
+    if not all(re.fullmatch(r"[\w-]+", part) for part in key):
+        return None
+    return key
@@ -0,0 +1,273 @@
+"""
+Concurrent page fetching shared by the scrapers.
+
+A full sync requests one page per year and sub-option, i.e. a few hundred
+pages. Instead of fetching them one after another, the scrapers hand the
+whole list to a `PageFetcher`, which requests them from a thread pool while
+keeping the load on the source website bounded:
+
+- at most `max_in_flight` requests are in progress at once, across every
+  scraper sharing the fetcher;
+- consecutive requests to the same host start at least `host_interval`
+  seconds apart;
+- requests failing with a transient error are retried with exponential
+  backoff, without holding their slot while they wait, and every host has
+  a circuit breaker failing requests fast while it is down.
+
+A fetch can be cancelled through a `threading.Event`: once it is set, no
+further page is requested and the pages still pending fail with
+`SyncCancelledException`.
+
+Each page may also go through a processing step, such as parsing, run once
+its request slot is released: extra threads wait on the processing, so the
+slots keep downloading the following pages in the meantime.
+
+Results are returned in the order of the requested URLs, so the scrapers
+reassemble their tables exactly as a sequential crawl would.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+from api.core.config import settings
+from api.exceptions.sync_cancelled_exception import SyncCancelledException
+from api.services.scrapers.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    is_transient,
+)
+
+T = TypeVar("T")
+
+
+class PageFetcher:
+    """
+    Fetches pages concurrently with bounded parallelism and per-host
+    politeness.
+
+    Attributes:
+        max_in_flight (int): Maximum number of requests in progress at once.
+        host_interval (float): Minimum delay, in seconds, between the starts
+            of two requests to the same host.
+        max_processing (int): Threads available, on top of the request
+            slots, to wait on the processing of fetched pages.
+        retry (RetryPolicy): Retry policy of failed requests.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        host_interval: Optional[float] = None,
+        max_processing: Optional[int] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        self.max_in_flight = (
+            max_in_flight
+            if max_in_flight is not None
+            else settings.SCRAPER_MAX_IN_FLIGHT
+        )
+        self.host_interval = (
+            host_interval
+            if host_interval is not None
+            else settings.SCRAPER_HOST_INTERVAL
+        )
+        self.max_processing = (
+            max_processing
+            if max_processing is not None
+            else max(settings.SCRAPER_PARSE_WORKERS, 1)
+        )
+        self.retry = retry or RetryPolicy()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._hosts_lock = threading.Lock()
+        self._next_start: Dict[str, float] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def fetch_all(
+        self,
+        urls: Sequence[str],
+        read: Callable[[str], Any],
+        process: Optional[Callable[[Any], T]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> List[T]:
+        """
+        Reads every URL concurrently.
+
+        Args:
+            urls (Sequence[str]): Pages to fetch.
+            read (Callable[[str], Any]): Function fetching one page, run
+                while holding a request slot.
+            process (Callable[[Any], T], optional): Function turning the
+                result of `read` into the final result, e.g. parsing the
+                page, run after the request slot is released.
+            cancel (threading.Event, optional): Stops the fetch once set.
+
+        Returns:
+            List[T]: The result of each URL, in the order of `urls`.
+
+        Raises:
+            SyncCancelledException: If the fetch was cancelled.
+            Exception: The error of the first page that failed, in URL
+                order. Pages not started yet are cancelled.
+        """
+        if not urls:
+            return []
+
+        workers = self.max_in_flight
+        if process is not None:
+            workers += self.max_processing
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(urls)),
+            thread_name_prefix="page-fetcher",
+        ) as executor:
+            futures = [
+                executor.submit(self._fetch, url, read, process, cancel)
+                for url in urls
+            ]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def fetch(
+        self,
+        url: str,
+        read: Callable[[str], T],
+        cancel: Optional[threading.Event] = None,
+    ) -> T:
+        """
+        Reads a single URL through the same request slots, host spacing,
+            retries and circuit breaker as `fetch_all`.
+
+        Args:
+            url (str): Page to fetch.
+            read (Callable[[str], T]): Function fetching the page.
+            cancel (threading.Event, optional): Stops the fetch once set.
+
+        Returns:
+            T: The result of `read`.
+
+        Raises:
+            CircuitOpenException: If the circuit of the host is open.
+            SyncCancelledException: If the fetch was cancelled.
+            Exception: The error of the last attempt.
+        """
+        return self._fetch(url, read, None, cancel)
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """
+        Returns the circuit breaker of a host.
+
+        Args:
+            host (str): Network location of the host, e.g.
+                "vitibrasil.cnpuv.embrapa.br".
+
+        Returns:
+            CircuitBreaker: The breaker shared by every request to it.
+        """
+        with self._hosts_lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker()
+            return self._breakers[host]
+
+    def _fetch(
+        self,
+        url: str,
+        read: Callable[[str], Any],
+        process: Optional[Callable[[Any], T]],
+        cancel: Optional[threading.Event] = None,
+    ) -> T:
+        """
+        Reads one page once a request slot and the host's turn are free,
+        retrying transient failures, then processes it after releasing the
+        slot.
+        """
+        page = self._read(url, read, cancel)
+        if process is None:
+            return page
+        try:
+            return process(page)
+        except SyncCancelledException:
+            raise
+        except Exception as e:
+            print(f"[ERROR] Failed to process {url}: {e}")
+            raise
+
+    def _read(
+        self,
+        url: str,
+        read: Callable[[str], Any],
+        cancel: Optional[threading.Event] = None,
+    ) -> Any:
+        """
+        Reads one page, retrying transient failures with backoff. The slot
+        is released while waiting for a retry, which a cancellation cuts
+        short.
+        """
+        host = urlsplit(url).netloc
+        breaker = self.breaker(host)
+        attempt = 0
+        while True:
+            with self._slots:
+                raise_if_cancelled(cancel)
+                breaker.before_request()
+                self._wait_for_host(host)
+                print(f"Requesting {url}...")
+                try:
+                    page = read(url)
+                except Exception as e:
+                    error = e
+                else:
+                    breaker.record_success()
+                    return page
+
+            if not is_transient(error):
+                # The host answered: the failure is specific to the page
+                breaker.record_success()
+                print(f"[ERROR] Failed to fetch {url}: {error}")
+                raise error
+            breaker.record_failure()
+            if not self.retry.should_retry(error, attempt):
+                print(f"[ERROR] Failed to fetch {url}: {error}")
+                raise error
+
+            delay = self.retry.delay(error, attempt)
+            print(f"[WARN] Retrying {url} in {delay:.1f}s: {error}")
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise SyncCancelledException()
+            attempt += 1
+
+    def _wait_for_host(self, host: str):
+        """
+        Blocks until a request to the host may start, reserving the next
+        start time so concurrent callers are spaced out.
+        """
+        with self._hosts_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.host_interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def raise_if_cancelled(cancel: Optional[threading.Event]):
+    """
+    Stops a cancelled fetch or sync.
+
+    Args:
+        cancel (Optional[threading.Event]): Event set to cancel it.
+
+    Raises:
+        SyncCancelledException: If the event is set.
+    """
+    if cancel is not None and cancel.is_set():
+        raise SyncCancelledException()
+
+
+page_fetcher = PageFetcher()
@@ -0,0 +1,89 @@
+"""
+Process pool parsing the pages fetched by the scrapers.
+
+Extracting the data table of a page is CPU-bound. Run on the fetching
+threads, it competes for the GIL with the downloads and a sync never uses
+more than one core. The `ParsePool` hands the raw pages to worker processes
+instead, so pages are parsed on every core while the fetching threads keep
+downloading.
+
+The pool is started on first use and shared by every sync; its workers are
+spawned rather than forked, as the API process runs other threads.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import pandas as pd
+
+from api.core.config import settings
+from api.services.scrapers.table_extractor import extract_table
+
+
+class ParsePool:
+    """
+    Extracts the data table of pages in worker processes.
+
+    Attributes:
+        workers (int): Number of worker processes; 0 extracts the tables in
+            the calling thread.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = (
+            workers if workers is not None else settings.SCRAPER_PARSE_WORKERS
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def extract_table(self, content: bytes) -> pd.DataFrame:
+        """
+        Extracts the data table of a page, blocking until it is parsed.
+
+        Args:
+            content (bytes): Raw HTML of the page.
+
+        Returns:
+            pd.DataFrame: The data table of the page.
+
+        Raises:
+            ValueError: If the page has no data table.
+            BrokenProcessPool: If a worker process died; the next call
+                starts a new pool.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return extract_table(content)
+        try:
+            return executor.submit(extract_table, content).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def shutdown(self):
+        """
+        Stops the worker processes. The pool starts again on next use.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+
+parse_pool = ParsePool()
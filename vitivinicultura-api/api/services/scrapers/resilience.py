@@ -0,0 +1,206 @@
+"""
+Retries and circuit breaking for the requests made to Embrapa.
+
+Embrapa occasionally times out or answers with server errors. A failed
+page is retried with exponential backoff and full jitter: attempt `n`
+waits a random delay between 0 and `min(max_delay, base_delay * 2**n)`,
+so concurrent scrapers do not retry in lockstep. A `Retry-After` header
+sent with a 429 or 503 answer is honored, up to `max_delay`.
+
+Consecutive failures are counted per host by a `CircuitBreaker`. Once they
+reach its threshold, the circuit opens and requests fail immediately for a
+cooldown period instead of adding load to a website that is down; a single
+trial request is then let through, and closes the circuit if it succeeds.
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+from api.core.config import settings
+from api.exceptions.circuit_open_exception import CircuitOpenException
+
+# HTTP statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Attributes:
+        attempts (int): Maximum number of attempts per request, including
+            the first one.
+        base_delay (float): Upper bound, in seconds, of the delay before
+            the first retry; doubled on every retry.
+        max_delay (float): Upper bound, in seconds, of any delay.
+    """
+
+    def __init__(
+        self,
+        attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+    ):
+        self.attempts = max(
+            (
+                attempts
+                if attempts is not None
+                else settings.SCRAPER_RETRY_ATTEMPTS
+            ),
+            1,
+        )
+        self.base_delay = (
+            base_delay
+            if base_delay is not None
+            else settings.SCRAPER_RETRY_BASE_DELAY
+        )
+        self.max_delay = (
+            max_delay
+            if max_delay is not None
+            else settings.SCRAPER_RETRY_MAX_DELAY
+        )
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        Checks whether a request that failed may be attempted again.
+
+        Args:
+            error (Exception): Error raised by the attempt.
+            attempt (int): Number of the failed attempt, starting at 0.
+
+        Returns:
+            bool: True if the error is transient and attempts remain.
+        """
+        return attempt + 1 < self.attempts and is_transient(error)
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        """
+        Returns how long to wait before retrying a failed attempt.
+
+        Args:
+            error (Exception): Error raised by the attempt.
+            attempt (int): Number of the failed attempt, starting at 0.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2**attempt)
+        )
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker counting consecutive failures of a host.
+
+    Attributes:
+        threshold (int): Consecutive failures opening the circuit.
+        cooldown (float): Seconds the circuit stays open before a trial
+            request is let through.
+        failures (int): Current number of consecutive failures.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+    ):
+        self.threshold = max(
+            (
+                threshold
+                if threshold is not None
+                else settings.SCRAPER_BREAKER_THRESHOLD
+            ),
+            1,
+        )
+        self.cooldown = (
+            cooldown
+            if cooldown is not None
+            else settings.SCRAPER_BREAKER_COOLDOWN
+        )
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        Checks that a request may be sent, letting a single trial request
+        through once the cooldown has elapsed.
+
+        Raises:
+            CircuitOpenException: If the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial and self._cooled_down():
+                self._trial = True
+                return
+        raise CircuitOpenException(
+            f"Upstream circuit is open after {self.failures} consecutive "
+            "failures."
+        )
+
+    def record_success(self):
+        """
+        Closes the circuit and resets the failure count.
+        """
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        """
+        Counts a failed request, opening the circuit at the threshold or
+        reopening it if the trial request failed.
+        """
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+    def _cooled_down(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.cooldown
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Checks whether a request error may succeed if retried: connection
+    errors, timeouts, throttling and server errors.
+
+    Args:
+        error (Exception): Error raised by a request.
+
+    Returns:
+        bool: True if the request is worth retrying.
+    """
+    if isinstance(error, HTTPError):
+        response = error.response
+        return response is not None and (
+            response.status_code in RETRYABLE_STATUSES
+        )
+    return isinstance(error, (ConnectionError, Timeout))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """
+    Reads the delay, in seconds, requested by a Retry-After header.
+    """
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return max(float(response.headers.get("Retry-After", "")), 0.0)
+    except ValueError:
+        return None
@@ -0,0 +1,108 @@
+"""
+Declarative description of the Embrapa categories.
+
+Every category is scraped by the same `ScraperEngine`; what differs between
+them (the `opcao` of its pages, its sub-options, the column naming each row
+and the numeric columns) is described by a `ScraperSpec`. Supporting a new
+category only takes a new entry in `scraper_specs`.
+"""
+
+from typing import Dict, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ScraperSpec(BaseModel):
+    """
+    Describes how to scrape and clean the table of a category.
+
+    Attributes:
+        opcao (str): Value of the `opcao` query parameter of its pages.
+        label_column (str): Column naming each row (country, product or
+            cultivar), also holding the category headers.
+        numeric_columns (Tuple[str, ...]): Columns holding quantities or
+            values.
+        suboptions (Dict[str, str]): Maps the `subopcao` of each page to
+            the label stored in the "subopcao" column. Categories without
+            sub-options have a single page per year and no such column.
+        categorized (bool): Whether rows are grouped under uppercase
+            category headers, propagated to a "Categoria" column.
+        excluded_headers (Tuple[str, ...]): Uppercase values that are
+            products rather than category headers.
+        dropped_columns (Tuple[str, ...]): Filler columns removed from the
+            pages, when present.
+        renamed_columns (Dict[str, str]): Page columns renamed in the
+            table, e.g. to repair their encoding.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    opcao: str
+    label_column: str
+    numeric_columns: Tuple[str, ...]
+    suboptions: Dict[str, str] = {}
+    categorized: bool = False
+    excluded_headers: Tuple[str, ...] = ()
+    dropped_columns: Tuple[str, ...] = ("Unnamed: 2",)
+    renamed_columns: Dict[str, str] = {}
+
+
+scraper_specs = {
+    "exportation": ScraperSpec(
+        opcao="opt_06",
+        label_column="Países",
+        numeric_columns=("Quantidade (Kg)", "Valor (US$)"),
+        suboptions={
+            "subopt_01": "Vinhos de mesa",
+            "subopt_02": "Espumantes",
+            "subopt_03": "Uvas frescas",
+            "subopt_04": "Uvas passas",
+        },
+        dropped_columns=("Unnamed: 2", "Sem definiÃ§Ã£o"),
+        renamed_columns={"PaÃ­ses": "Países"},
+    ),
+    "importation": ScraperSpec(
+        opcao="opt_05",
+        label_column="Países",
+        numeric_columns=("Quantidade (Kg)", "Valor (US$)"),
+        suboptions={
+            "subopt_01": "Vinhos de mesa",
+            "subopt_02": "Espumantes",
+            "subopt_03": "Uvas frescas",
+            "subopt_04": "Uvas passas",
+            "subopt_05": "Suco de uva",
+        },
+        dropped_columns=("Unnamed: 2", "Sem definiÃ§Ã£o"),
+        renamed_columns={"PaÃ­ses": "Países"},
+    ),
+    "processing": ScraperSpec(
+        opcao="opt_03",
+        label_column="Cultivar",
+        numeric_columns=("Quantidade (Kg)",),
+        suboptions={
+            "subopt_01": "Viníferas",
+            "subopt_02": "Americanas e híbridas",
+            "subopt_03": "Uvas de mesa",
+            "subopt_04": "Sem classificação",
+        },
+        categorized=True,
+        dropped_columns=("Unnamed: 2", "Sem definiÃ§Ã£o"),
+    ),
+    "production": ScraperSpec(
+        opcao="opt_02",
+        label_column="Produto",
+        numeric_columns=("Quantidade (L.)",),
+        categorized=True,
+    ),
+    "trade": ScraperSpec(
+        opcao="opt_04",
+        label_column="Produto",
+        numeric_columns=("Quantidade (L.)",),
+        categorized=True,
+        excluded_headers=(
+            "VINHO FRIZANTE",
+            "VINHO ORGÂNICO",
+            "SUCO DE UVAS CONCENTRADO",
+        ),
+    ),
+}
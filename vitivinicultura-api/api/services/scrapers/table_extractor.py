@@ -0,0 +1,119 @@
+"""
+Targeted extractor for the data table of the Embrapa pages.
+
+`pd.read_html` builds a DataFrame for every `<table>` of a page, only for
+the scrapers to keep the one holding the data. This extractor walks the
+page with a streaming lxml parse, stops at the first table with the
+`tb_dados` class, and converts only that one.
+
+Cell text is normalized as `pd.read_html` does, so the cleaning steps of
+the scrapers behave the same. Columns whose cells are all Brazilian-formatted
+integers ("1.234.567", with "-" for zero) are emitted as int64 directly;
+other columns are kept as text, with empty cells as NaN.
+"""
+
+import re
+from io import BytesIO
+from typing import List
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+from api.services.scrapers.cleaning import ZERO
+
+# CSS class of the data table in the Embrapa pages
+DATA_TABLE_CLASS = "tb_dados"
+
+# Integer with "." as thousands separator, as used by Embrapa
+_NUMBER = re.compile(r"\d{1,3}(?:\.\d{3})*")
+# Same whitespace normalization as pd.read_html
+_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+
+
+def extract_table(
+    content: bytes, table_class: str = DATA_TABLE_CLASS
+) -> pd.DataFrame:
+    """
+    Extracts the data table of a page.
+
+    Args:
+        content (bytes): Raw HTML of the page.
+        table_class (str): CSS class identifying the data table.
+
+    Returns:
+        pd.DataFrame: The table, with its header row as column names and
+            the rows of its body followed by those of its footer.
+
+    Raises:
+        ValueError: If the page has no table with the given class.
+    """
+    parser = etree.iterparse(
+        BytesIO(content), events=("end",), tag="table", html=True
+    )
+    for _, table in parser:
+        if table_class in (table.get("class") or "").split():
+            return _to_frame(table)
+        # Tables end before their enclosing elements, so an unmatched table
+        #   never contains the data table and can be released.
+        table.clear()
+    raise ValueError(f"No table with class '{table_class}' found.")
+
+
+def _to_frame(table: etree._Element) -> pd.DataFrame:
+    """
+    Converts a parsed `<table>` into a DataFrame.
+    """
+    header = table.find("thead")
+    rows = [
+        row
+        for section in ("thead", "tbody", "tfoot")
+        for row in table.iterfind(f"{section}/tr")
+    ]
+    rows += table.findall("tr")
+    if header is not None and header.find("tr") is not None:
+        rows = rows[len(header.findall("tr")) :]
+        names = _cells(header.find("tr"))
+    elif rows:
+        names, rows = _cells(rows[0]), rows[1:]
+    else:
+        names = []
+
+    columns = [
+        name or f"Unnamed: {position}" for position, name in enumerate(names)
+    ]
+    values = [_cells(row) for row in rows]
+    data = {
+        name: _typed([row[i] if i < len(row) else "" for row in values])
+        for i, name in enumerate(columns)
+    }
+    return pd.DataFrame(data, columns=columns)
+
+
+def _cells(row: etree._Element) -> List[str]:
+    """
+    Returns the normalized text of the cells of a table row.
+    """
+    return [
+        _WHITESPACE.sub(" ", "".join(cell.itertext()).strip())
+        for cell in row
+        if cell.tag in ("td", "th")
+    ]
+
+
+def _typed(cells: List[str]) -> np.ndarray:
+    """
+    Converts the cells of a column to int64 if they all hold integers, or
+    to an object array with empty cells as NaN otherwise.
+    """
+    if cells and all(
+        cell == ZERO or _NUMBER.fullmatch(cell) for cell in cells
+    ):
+        return np.array(
+            [
+                0 if cell == ZERO else int(cell.replace(".", ""))
+                for cell in cells
+            ],
+            dtype=np.int64,
+        )
+    return np.array([cell if cell else np.nan for cell in cells], dtype=object)
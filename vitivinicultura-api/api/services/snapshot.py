@@ -0,0 +1,141 @@
+"""
+Columnar snapshots of the scraped category tables.
+
+Each sync writes its cleaned table as an Arrow IPC file. The API reads it
+back through a memory map, which avoids re-parsing text formats and lets
+numeric columns be used without copying. CSV and JSON responses are encoded
+from the loaded snapshot on demand, so no text export is written.
+
+A digest of the table is stored next to its snapshot, so a sync can tell
+whether the table it fetched differs from the published one without
+reading it back.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+SNAPSHOT_EXTENSION = "arrow"
+DIGEST_EXTENSION = "sha256"
+
+
+def snapshot_path(file_path: str, file_name: str) -> str:
+    """
+    Returns the path of the snapshot file for a table.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        str: Path of the Arrow IPC file.
+    """
+    return os.path.join(file_path, f"{file_name}.{SNAPSHOT_EXTENSION}")
+
+
+def digest_path(file_path: str, file_name: str) -> str:
+    """
+    Returns the path of the digest file of a table.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        str: Path of the file holding the digest of the snapshot.
+    """
+    return os.path.join(file_path, f"{file_name}.{DIGEST_EXTENSION}")
+
+
+def table_digest(df: pd.DataFrame) -> str:
+    """
+    Hashes the columns, column types and rows of a table.
+
+    Args:
+        df (pd.DataFrame): The table as stored, normalized by `to_typed`.
+
+    Returns:
+        str: Hex SHA-256 digest, equal for identical tables.
+    """
+    digest = hashlib.sha256()
+    schema = [[str(col), str(dtype)] for col, dtype in df.dtypes.items()]
+    digest.update(json.dumps(schema).encode("utf-8"))
+    rows = pd.util.hash_pandas_object(df, index=False)
+    digest.update(rows.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def write_snapshot(df: pd.DataFrame, file_path: str, file_name: str) -> str:
+    """
+    Writes a table as a typed Arrow IPC file.
+
+    The file is written under a temporary name and then renamed, so readers
+    never observe a partially written snapshot.
+
+    Args:
+        df (pd.DataFrame): The cleaned table.
+        file_path (str): Directory where the snapshot will be saved.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        str: Path of the written snapshot.
+    """
+    os.makedirs(file_path, exist_ok=True)
+
+    table = pa.Table.from_pandas(to_typed(df), preserve_index=False)
+    path = snapshot_path(file_path, file_name)
+    tmp_path = f"{path}.tmp"
+
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+    return path
+
+
+def read_snapshot(path: str) -> pd.DataFrame:
+    """
+    Loads a snapshot through a memory map.
+
+    Args:
+        path (str): Path of the Arrow IPC file.
+
+    Returns:
+        pd.DataFrame: The table. Numeric columns may share memory with the
+            mapped file, so the frame must be treated as read-only.
+    """
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def to_typed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalizes column types before a table is stored or served: float
+    columns holding only whole numbers (quantities and values) are stored
+    as integers, and missing text values are represented as None (null),
+    as they are when a snapshot is read back.
+
+    Args:
+        df (pd.DataFrame): The table.
+
+    Returns:
+        pd.DataFrame: The table with normalized column types.
+    """
+    df = df.astype(
+        {col: "int64" for col in df.columns if _holds_whole_numbers(df[col])}
+    )
+    for col in df.columns:
+        if df[col].dtype == object and df[col].isna().any():
+            df[col] = df[col].where(df[col].notna(), None)
+    return df
+
+
+def _holds_whole_numbers(series: pd.Series) -> bool:
+    if not pd.api.types.is_float_dtype(series) or series.isna().any():
+        return False
+    return bool((series % 1 == 0).all())
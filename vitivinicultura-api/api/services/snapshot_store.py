@@ -0,0 +1,257 @@
+"""
+Versioned publication of the cached category tables.
+
+Each sync writes every file of a table (Arrow snapshot, its digest,
+precompressed downloads) into a new version directory:
+
+    <cache folder>/snapshots/<table>/<version>/
+
+Files of a version are never modified once written. The version is then
+published by replacing the table's `CURRENT` pointer file with a rename,
+which is atomic: readers see either the previous version or the new one,
+never a partially written table, and never need a lock.
+
+A request pins the version it read from the pointer and keeps using its
+directory, even if a sync publishes a new version meanwhile. The most
+recent versions (SNAPSHOT_RETENTION) are kept so those requests can finish.
+
+Tables cached before versioned snapshots existed have no pointer; their
+files are read from the cache folder itself.
+
+Next to the pointer, a `LAST_FULL_SYNC` file records when every year of the
+table was last fetched, so incremental syncs know when a full one is due
+across restarts.
+"""
+
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from api.core.config import settings
+
+# Folder of the cache folder holding the versions of every table
+SNAPSHOTS_FOLDER = "snapshots"
+
+# File naming the published version of a table
+POINTER_FILE = "CURRENT"
+
+# File recording when a table was last synced in full
+FULL_SYNC_FILE = "LAST_FULL_SYNC"
+
+# Format of the creation time prefixing the versions
+VERSION_TIME_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+def current_version(file_path: str, file_name: str) -> Optional[str]:
+    """
+    Reads the version currently published for a table.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        Optional[str]: The published version, or None if the table has
+            never been published.
+    """
+    try:
+        with open(_pointer_path(file_path, file_name), encoding="utf-8") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return version or None
+
+
+def current_folder(file_path: str, file_name: str) -> str:
+    """
+    Resolves the folder holding the published files of a table. The result
+    pins the version: its files do not change when a new one is published.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        str: Directory of the current version, or the cache folder itself
+            if the table has never been published.
+    """
+    version = current_version(file_path, file_name)
+    if version is None:
+        return file_path
+    return version_folder(file_path, file_name, version)
+
+
+def version_folder(file_path: str, file_name: str, version: str) -> str:
+    """
+    Returns the directory of a version of a table.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        version (str): Version of the table.
+
+    Returns:
+        str: Path of the version directory.
+    """
+    return os.path.join(_table_folder(file_path, file_name), version)
+
+
+def create_version(file_path: str, file_name: str) -> Tuple[str, str]:
+    """
+    Creates the directory of a new, unpublished version of a table.
+
+    Versions are named after their creation time, so they sort in the
+    order they were written.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        Tuple[str, str]: The new version and its directory.
+    """
+    created_at = datetime.now(timezone.utc).strftime(VERSION_TIME_FORMAT)
+    version = f"{created_at}-{uuid.uuid4().hex[:8]}"
+    folder = version_folder(file_path, file_name, version)
+    os.makedirs(folder)
+    return version, folder
+
+
+def publish(file_path: str, file_name: str, version: str):
+    """
+    Makes a fully written version the current one, then removes the
+    versions older than the retained ones.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        version (str): Version to publish.
+    """
+    pointer = _pointer_path(file_path, file_name)
+    tmp_pointer = f"{pointer}.{version}.tmp"
+    with open(tmp_pointer, "w", encoding="utf-8") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_pointer, pointer)
+
+    prune(file_path, file_name)
+
+
+def last_full_sync(file_path: str, file_name: str) -> Optional[datetime]:
+    """
+    Reads when a table was last synced in full.
+
+    Tables published before full syncs were recorded fall back to the
+    creation time of their published version.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        Optional[datetime]: Time of the last full sync, or None if it is
+            unknown and the table needs one.
+    """
+    path = os.path.join(_table_folder(file_path, file_name), FULL_SYNC_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return datetime.fromisoformat(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        pass
+
+    version = current_version(file_path, file_name)
+    if version is None:
+        return None
+    try:
+        created_at = datetime.strptime(
+            version.split("-")[0], VERSION_TIME_FORMAT
+        )
+    except ValueError:
+        return None
+    return created_at.replace(tzinfo=timezone.utc)
+
+
+def record_full_sync(
+    file_path: str, file_name: str, synced_at: Optional[datetime] = None
+):
+    """
+    Records that every year of a table was fetched, whether or not a new
+    version was published.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        synced_at (datetime, optional): Time of the sync. Defaults to now.
+    """
+    synced_at = synced_at or datetime.now(timezone.utc)
+    folder = _table_folder(file_path, file_name)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, FULL_SYNC_FILE)
+    tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(synced_at.isoformat())
+    os.replace(tmp_path, path)
+
+
+def discard(file_path: str, file_name: str, version: str):
+    """
+    Removes a version that could not be fully written.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        version (str): Unpublished version to remove.
+    """
+    shutil.rmtree(
+        version_folder(file_path, file_name, version), ignore_errors=True
+    )
+
+
+def prune(file_path: str, file_name: str, retention: Optional[int] = None):
+    """
+    Removes the oldest versions of a table. The current version is always
+    kept.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+        retention (int, optional): Number of most recent versions to keep.
+            Defaults to SNAPSHOT_RETENTION.
+    """
+    if retention is None:
+        retention = settings.SNAPSHOT_RETENTION
+    current = current_version(file_path, file_name)
+    versions = list_versions(file_path, file_name)
+    for version in versions[: -max(retention, 1)]:
+        if version != current:
+            discard(file_path, file_name, version)
+
+
+def list_versions(file_path: str, file_name: str) -> List[str]:
+    """
+    Lists the versions stored for a table, oldest first.
+
+    Args:
+        file_path (str): Directory holding the cached tables.
+        file_name (str): Name of the table (without extension).
+
+    Returns:
+        List[str]: The versions, published or not.
+    """
+    try:
+        entries = os.scandir(_table_folder(file_path, file_name))
+    except FileNotFoundError:
+        return []
+    with entries:
+        return sorted(entry.name for entry in entries if entry.is_dir())
+
+
+def _table_folder(file_path: str, file_name: str) -> str:
+    return os.path.join(file_path, SNAPSHOTS_FOLDER, file_name)
+
+
+def _pointer_path(file_path: str, file_name: str) -> str:
+    return os.path.join(_table_folder(file_path, file_name), POINTER_FILE)
@@ -0,0 +1,301 @@
+"""
+Single-flight registry of the category sync jobs.
+
+Every sync of a category, whether requested through the API or run by the
+scheduler, goes through the `SyncJobRegistry`. Requests for a category
+that already has a job in flight are coalesced onto it instead of starting
+another scrape of the same pages:
+
+- an incremental request joins the job in flight, whatever its mode;
+- a full request joins a full job in flight, or otherwise queues a single
+  full job that starts once the current one finishes. Later requests join
+  that queued job.
+
+Across processes (several uvicorn workers), a job only scrapes while it
+holds the lease of its category, so two workers never write the same
+table at once; a job waiting for another worker stays queued. If the
+lease cannot be renewed, the scrape is cancelled and stops before
+writing anything else, and the job fails. Jobs requested only by the
+scheduler are tagged, so that a worker losing the scheduler lease cancels
+them without touching the syncs requested through the API.
+
+Jobs are identified by an ID that can be polled for their state, progress
+and the snapshot version they published. Finished jobs are kept in a
+bounded history (SYNC_JOB_HISTORY).
+"""
+
+import asyncio
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from api.core.config import settings
+from api.services import snapshot_store
+from api.services.leases import Lease
+from api.services.scrapers.engine import ScraperEngine
+from api.services.scrapers.specs import scraper_specs
+
+# States of a job that has not finished yet
+ACTIVE_STATES = ("queued", "running")
+
+# Seconds between two attempts to take the lease of a category
+LEASE_RETRY_DELAY = 1.0
+
+
+class SyncJob:
+    """
+    A sync of one category.
+
+    Attributes:
+        job_id (str): Identifier of the job.
+        category (str): Name of the category.
+        full (bool): Whether every year is fetched again.
+        state (str): "queued", "running", then "completed" (a new version
+            was published), "unchanged" or "failed".
+        requests (int): Sync requests coalesced onto the job, including the
+            one that created it.
+        scheduled (bool): Whether every request served by the job came
+            from the scheduler.
+        created_at (datetime): When the job was requested.
+        started_at (Optional[datetime]): When the scrape started.
+        finished_at (Optional[datetime]): When the job finished.
+        snapshot_version (Optional[str]): Version of the table published
+            when the job finished.
+    """
+
+    def __init__(self, category: str, full: bool, scheduled: bool = False):
+        self.job_id = uuid.uuid4().hex
+        self.category = category
+        self.full = full
+        self.state = "queued"
+        self.requests = 1
+        self.scheduled = scheduled
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.snapshot_version: Optional[str] = None
+        self.scraper: Optional[ScraperEngine] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cancel = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether the job is queued or running.
+        """
+        return self.state in ACTIVE_STATES
+
+    @property
+    def pages_fetched(self) -> int:
+        """
+        Pages fetched so far by the scrape.
+        """
+        return self.scraper.pages_fetched if self.scraper else 0
+
+    @property
+    def pages_resumed(self) -> int:
+        """
+        Pages read back from the checkpoint of an interrupted sync instead
+        of being fetched again.
+        """
+        return self.scraper.pages_resumed if self.scraper else 0
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        Seconds the scrape has been running, or took once finished.
+        """
+        if self.started_at is None:
+            return None
+        end = self.finished_at or datetime.now(timezone.utc)
+        return (end - self.started_at).total_seconds()
+
+    def cancel(self):
+        """
+        Cancels the job: a queued job will not start, a running scrape
+        stops before writing anything else.
+        """
+        self._cancel.set()
+
+    async def wait(self) -> "SyncJob":
+        """
+        Waits for the job to finish.
+
+        Returns:
+            SyncJob: The finished job.
+        """
+        await asyncio.shield(self._task)
+        return self
+
+
+class SyncJobRegistry:
+    """
+    Coalesces the sync requests of each category onto a single job in
+    flight. Must be used from the event loop running the jobs.
+
+    Attributes:
+        history (int): Number of finished jobs kept for polling.
+    """
+
+    def __init__(self, history: Optional[int] = None):
+        self.history = (
+            history if history is not None else settings.SYNC_JOB_HISTORY
+        )
+        self._jobs: "OrderedDict[str, SyncJob]" = OrderedDict()
+        self._latest: Dict[str, SyncJob] = {}
+
+    def submit(
+        self, category: str, full: bool = False, scheduled: bool = False
+    ) -> SyncJob:
+        """
+        Returns the job a sync request is served by, starting a new one
+        only if no job in flight covers the request.
+
+        Args:
+            category (str): Name of the category.
+            full (bool): Fetch every year again.
+            scheduled (bool): Whether the request comes from the
+                scheduler.
+
+        Returns:
+            SyncJob: The job in flight or queued, or a new one.
+        """
+        latest = self._latest.get(category)
+        if latest is not None and latest.active:
+            if latest.full or not full:
+                latest.requests += 1
+                latest.scheduled = latest.scheduled and scheduled
+                return latest
+
+        job = SyncJob(category, full, scheduled)
+        previous = latest if latest is not None and latest.active else None
+        job._task = asyncio.create_task(self._run(job, previous))
+        self._latest[category] = job
+        self._jobs[job.job_id] = job
+        self._trim()
+        return job
+
+    def get(self, category: str, job_id: str) -> Optional[SyncJob]:
+        """
+        Looks up a job of a category.
+
+        Args:
+            category (str): Name of the category.
+            job_id (str): Identifier of the job.
+
+        Returns:
+            Optional[SyncJob]: The job, or None if it is unknown or no
+                longer kept.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.category != category:
+            return None
+        return job
+
+    async def _run(self, job: SyncJob, previous: Optional[SyncJob]):
+        """
+        Runs the scrape of a job, after the job it was queued behind. The
+        job always ends in a finished state, even if the previous job
+        failed or this one is cancelled or fails unexpectedly.
+        """
+        synced = False
+        try:
+            if previous is not None:
+                # Not previous.wait(), which raises the error or
+                #   cancellation of the previous job: this one runs anyway
+                await asyncio.wait([previous._task])
+            synced = await self._scrape(job)
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+        except Exception as e:
+            print(f"[SYNC-ERROR] {job.category} sync job failed: {e}")
+        finally:
+            if not synced or job._cancel.is_set():
+                job.state = "failed"
+            else:
+                job.state = "completed" if job.scraper.changed else "unchanged"
+            job.snapshot_version = snapshot_store.current_version(
+                settings.LOCAL_CACHE_FOLDER, f"table_{job.category}"
+            )
+            job.finished_at = datetime.now(timezone.utc)
+            self._trim()
+
+    async def _scrape(self, job: SyncJob) -> bool:
+        """
+        Scrapes the table of a job while holding the lease of its
+        category.
+
+        Returns:
+            bool: Whether the sync succeeded; False if the job was
+                cancelled before the lease was taken.
+        """
+        lease = Lease(f"sync:{job.category}")
+        leased = False
+        while not job._cancel.is_set():
+            leased = await lease.acquire_async()
+            if leased:
+                break
+            await asyncio.sleep(LEASE_RETRY_DELAY)
+        if not leased:
+            return False
+
+        renewal = asyncio.create_task(_renew(lease, job._cancel))
+        job.state = "running"
+        job.started_at = datetime.now(timezone.utc)
+        job.scraper = ScraperEngine(scraper_specs[job.category])
+        try:
+            # The thread is always awaited, even once cancelled, so the
+            #   lease is only released after the scrape has stopped
+            return await asyncio.to_thread(
+                job.scraper.sync,
+                settings.EMBRAPA_URL,
+                settings.LOCAL_CACHE_FOLDER,
+                f"table_{job.category}",
+                job.full,
+                job._cancel,
+            )
+        finally:
+            renewal.cancel()
+            await lease.release_async()
+
+    async def cancel_scheduled(self):
+        """
+        Cancels the jobs in flight requested only by the scheduler, and
+        waits until their scrapes have stopped. Jobs also serving API
+        requests keep running under their own lease.
+        """
+        active = [
+            job for job in self._jobs.values() if job.active and job.scheduled
+        ]
+        for job in active:
+            job.cancel()
+        await asyncio.gather(
+            *(job.wait() for job in active), return_exceptions=True
+        )
+
+    def _trim(self):
+        """
+        Drops the oldest finished jobs beyond the history size.
+        """
+        finished = [job_id for job_id, j in self._jobs.items() if not j.active]
+        for job_id in finished[: max(len(finished) - self.history, 0)]:
+            del self._jobs[job_id]
+
+
+async def _renew(lease: Lease, cancel: threading.Event):
+    """
+    Renews a lease until cancelled; if it cannot be renewed, cancels the
+    scrape it guards.
+    """
+    while True:
+        await asyncio.sleep(lease.ttl / 3)
+        if not await lease.acquire_async():
+            print(f"[SYNC] Lost the lease {lease.name}, cancelling the sync.")
+            cancel.set()
+            return
+
+
+sync_jobs = SyncJobRegistry()
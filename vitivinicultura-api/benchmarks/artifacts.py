@@ -0,0 +1,71 @@
+"""
+Benchmarks the precompressed downloads written by each sync.
+
+Writes the artifacts of every cached table (CSV, JSON and NDJSON, each
+gzip and brotli compressed) at several brotli qualities, and reports how
+long it took and the total size of the brotli files, to choose
+ARTIFACT_BROTLI_QUALITY.
+
+Usage (from the vitivinicultura-api folder, after a sync):
+
+    python -m benchmarks.artifacts [--cache data] [--qualities 5 9 11]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+import time
+
+from api.core.config import settings
+from api.services.artifacts import write_artifacts
+from api.services.snapshot import snapshot_path
+from api.services.snapshot_store import current_folder
+from api.services.scrapers.specs import scraper_specs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--cache",
+        default=settings.LOCAL_CACHE_FOLDER,
+        help="Cache folder holding the published tables.",
+    )
+    parser.add_argument(
+        "--qualities",
+        type=int,
+        nargs="+",
+        default=[5, 7, 9, 11],
+        help="Brotli qualities to compare.",
+    )
+    args = parser.parse_args()
+
+    tables = []
+    for category in scraper_specs:
+        file_name = f"table_{category}"
+        path = snapshot_path(current_folder(args.cache, file_name), file_name)
+        if os.path.exists(path):
+            tables.append((file_name, path))
+    if not tables:
+        parser.error(f"No snapshots found in {args.cache}")
+
+    print(f"{'Quality':>7} {'Time':>9} {'Brotli size':>12}")
+    for quality in args.qualities:
+        settings.ARTIFACT_BROTLI_QUALITY = quality
+        elapsed = size = 0
+        for file_name, path in tables:
+            with tempfile.TemporaryDirectory() as folder:
+                shutil.copy(path, folder)
+                start = time.perf_counter()
+                write_artifacts(folder, file_name)
+                elapsed += time.perf_counter() - start
+                size += sum(
+                    os.path.getsize(artifact)
+                    for artifact in glob.glob(os.path.join(folder, "*.br"))
+                )
+        print(f"{quality:>7} {elapsed:>8.2f}s {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
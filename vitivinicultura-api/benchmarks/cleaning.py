@@ -0,0 +1,163 @@
+"""
+Benchmarks the cleaning stages on full-history tables.
+
+Assembles the raw table of each category with the scraper engine itself,
+from pages replayed offline from the fixture archive, then times the
+engine's vectorized cleaning pass against the row-at-a-time stages the
+scrapers used before, and checks that both produce the same table. With
+--years, only the last years are assembled, as in an incremental sync.
+
+Usage (from the vitivinicultura-api folder, after recording the pages with
+python -m benchmarks.sync --record):
+
+    python -m benchmarks.cleaning [--fixtures data/fixtures/embrapa.zip]
+        [--repeat 3] [--years 2]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from api.core.config import settings
+from api.services.scrapers.engine import ScraperEngine
+from api.services.scrapers.http_client import HttpClient
+from api.services.scrapers.page_archive import PageArchive
+from api.services.scrapers.page_fetcher import PageFetcher
+from api.services.scrapers.specs import scraper_specs
+
+
+def _legacy_clean(df, spec):
+    label, numbers = spec.label_column, spec.numeric_columns
+
+    def try_fix_encoding(x):
+        if not isinstance(x, str):
+            return x
+        try:
+            return x.encode("latin1").decode("utf-8")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return x
+
+    df[label] = df[label].astype(str).apply(try_fix_encoding)
+    for col in numbers:
+        df[col] = df[col].replace("-", "0")
+        df[col] = (
+            df[col]
+            .astype(str)
+            .str.replace(".", "", regex=False)
+            .str.replace("-", "", regex=False)
+            .str.strip()
+        )
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    if spec.categorized:
+        current_category = None
+        categories = []
+        for product in df[label]:
+            product_str = str(product).strip()
+            if product_str.isupper() and product_str not in (
+                "NAN",
+                *spec.excluded_headers,
+            ):
+                current_category = product_str
+            categories.append(current_category)
+        df["Categoria"] = categories
+
+    def is_product(x):
+        return isinstance(x, str) and (
+            not x.strip().isupper() or x.strip() in spec.excluded_headers
+        )
+
+    mask = df[label].apply(is_product)
+    df = df[mask].reset_index(drop=True)
+    return df[df[label] != "Total"].dropna(axis=0)
+
+
+def _clean(df, spec):
+    return ScraperEngine(spec)._clean(df)
+
+
+def _raw_table(spec, client, fetcher, years=None):
+    # Assembled by the engine itself, exactly as a sync does before
+    #   cleaning, through a throwaway archive so every page is parsed. The
+    #   request log is silenced to keep the report readable.
+    with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(
+        io.StringIO()
+    ):
+        engine = ScraperEngine(
+            spec,
+            client=client,
+            fetcher=fetcher,
+            archive=PageArchive(root=folder, client=client),
+        )
+        available = engine._get_years(settings.EMBRAPA_URL)
+        return engine._fetch_table(
+            settings.EMBRAPA_URL, available[-years:] if years else available
+        )
+
+
+def _best_time(clean, df, repeat, *args):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        copy = df.copy()
+        start = time.perf_counter()
+        result = clean(copy, *args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--fixtures",
+        default=settings.SCRAPER_FIXTURE_PATH,
+        help="Fixture archive the pages are replayed from.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per table; the best run is kept.",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        help="Assembles only the last years of each table (default: all).",
+    )
+    args = parser.parse_args()
+    if not os.path.exists(args.fixtures):
+        parser.error(f"No fixture archive at {args.fixtures}; record it")
+
+    client = HttpClient(fixture_mode="replay", fixture_path=args.fixtures)
+    # Replayed pages are not spaced out: there is no host to be polite to
+    fetcher = PageFetcher(host_interval=0)
+
+    print(f"{'Category':<12} {'Rows':>7} {'Row-wise':>10} {'Vectorized':>11}")
+    for category, spec in scraper_specs.items():
+        raw = _raw_table(spec, client, fetcher, args.years)
+        if raw.empty:
+            # E.g. the latest year, before Embrapa publishes its data
+            print(f"{category:<12} {0:>7}  no rows to clean")
+            continue
+
+        legacy_time, expected = _best_time(
+            _legacy_clean, raw, args.repeat, spec
+        )
+        vector_time, actual = _best_time(_clean, raw, args.repeat, spec)
+        same = expected.reset_index(drop=True).equals(
+            actual.reset_index(drop=True)
+        )
+        print(
+            f"{category:<12} {len(raw):>7} {legacy_time * 1000:>8.1f}ms"
+            f" {vector_time * 1000:>9.1f}ms"
+            f"  {legacy_time / vector_time:5.1f}x"
+            f"{'' if same else '  MISMATCH'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Stand-in Embrapa server replaying a fixture archive over HTTP.
+
+Serves the pages recorded in the fixture archive (see
+api/services/scrapers/fixtures.py) at the URLs they were fetched from,
+honoring conditional requests, so any version of the API, including those
+without the replay transport, can sync offline against them.
+
+Usage (from the vitivinicultura-api folder):
+
+    python -m benchmarks.replay_server [--fixtures data/fixtures/embrapa.zip]
+        [--port 8765]
+
+then run the API or the scrapers with
+EMBRAPA_URL=http://127.0.0.1:8765/index.php
+"""
+
+import argparse
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from api.core.config import settings
+from api.services.scrapers.fixtures import FixtureArchive
+
+
+def _handler(archive: FixtureArchive) -> type:
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, headers, body = archive.respond(self.path, self.headers)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--fixtures",
+        default=settings.SCRAPER_FIXTURE_PATH,
+        help="Fixture archive the pages are replayed from.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.fixtures):
+        parser.error(f"No fixture archive at {args.fixtures}")
+    archive = FixtureArchive(args.fixtures)
+    server = ThreadingHTTPServer((args.host, args.port), _handler(archive))
+    print(
+        f"Replaying {len(archive)} pages at "
+        f"http://{args.host}:{args.port}/index.php"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmarks full syncs of every category on recorded Embrapa pages.
+
+Runs a full sync of each category, from an empty cache and page archive,
+with the pages served offline from the fixture archive, and reports how
+long each one took. The runs are deterministic, so their timings can be
+compared across versions of the code.
+
+Usage (from the vitivinicultura-api folder):
+
+    # Record the pages once, from Embrapa
+    python -m benchmarks.sync --record
+
+    # Replay them offline
+    python -m benchmarks.sync [--fixtures data/fixtures/embrapa.zip]
+        [--repeat 3] [category ...]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from api.core.config import settings
+from api.services.scrapers.engine import ScraperEngine
+from api.services.scrapers.http_client import HttpClient
+from api.services.scrapers.page_archive import PageArchive
+from api.services.scrapers.page_fetcher import PageFetcher
+from api.services.scrapers.specs import scraper_specs
+
+
+def _sync(category: str, client: HttpClient, fetcher: PageFetcher):
+    # Syncs into a throwaway folder, so every page is fetched and parsed
+    with tempfile.TemporaryDirectory() as folder:
+        archive = PageArchive(
+            root=os.path.join(folder, "pages"), client=client
+        )
+        engine = ScraperEngine(
+            scraper_specs[category],
+            client=client,
+            fetcher=fetcher,
+            archive=archive,
+        )
+        start = time.perf_counter()
+        synced = engine.sync(
+            settings.EMBRAPA_URL, folder, f"table_{category}", full=True
+        )
+        return synced, time.perf_counter() - start, engine.pages_fetched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "categories",
+        nargs="*",
+        default=list(scraper_specs),
+        help="Categories to sync; all of them by default.",
+    )
+    parser.add_argument(
+        "--fixtures",
+        default=settings.SCRAPER_FIXTURE_PATH,
+        help="Fixture archive the pages are replayed from.",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Fetch the pages from EMBRAPA_URL and record them instead.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Syncs per category when replaying; the median is reported.",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.categories) - set(scraper_specs)
+    if unknown:
+        parser.error(f"Unknown categories: {', '.join(sorted(unknown))}")
+    if not args.record and not os.path.exists(args.fixtures):
+        parser.error(f"No fixture archive at {args.fixtures}; record it")
+
+    mode = "record" if args.record else "replay"
+    client = HttpClient(fixture_mode=mode, fixture_path=args.fixtures)
+    # Replayed pages are not spaced out: there is no host to be polite to
+    fetcher = PageFetcher(host_interval=0 if mode == "replay" else None)
+    repeat = 1 if args.record else max(args.repeat, 1)
+
+    results = {}
+    for category in args.categories:
+        timings = []
+        for _ in range(repeat):
+            synced, elapsed, pages = _sync(category, client, fetcher)
+            if not synced:
+                raise SystemExit(f"The {category} sync failed")
+            timings.append(elapsed)
+        results[category] = (statistics.median(timings), min(timings), pages)
+
+    print(f"\n{'Category':<12} {'Pages':>6} {'Median':>9} {'Best':>9}")
+    for category, (median, best, pages) in results.items():
+        print(f"{category:<12} {pages:>6} {median:>8.2f}s {best:>8.2f}s")
+    total = sum(median for median, _, _ in results.values())
+    print(f"{'Total':<12} {'':>6} {total:>8.2f}s")
+    if args.record:
+        print(f"\nRecorded {len(client.fixtures)} pages to {args.fixtures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmarks the data table extraction on archived Embrapa pages.
+
+Compares `pd.read_html(page)[3]`, used by the scrapers before, with the
+targeted `extract_table` on the raw pages stored by the page archive, and
+checks that both yield the same table.
+
+Usage (from the vitivinicultura-api folder, after a sync):
+
+    python -m benchmarks.table_extractor [--pages data/pages] [--repeat 5]
+"""
+
+import argparse
+import glob
+import gzip
+import os
+import time
+from io import BytesIO
+
+import pandas as pd
+
+from api.core.config import settings
+from api.services.scrapers.table_extractor import extract_table
+
+
+def _best_time(parse, content: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _same_table(expected: pd.DataFrame, actual: pd.DataFrame) -> bool:
+    # Compares the tables as the cleaning steps of the scrapers see them:
+    #   cells as text, with the thousands separators removed from numbers.
+    #   read_html reads some integer columns as decimals ("24.440" becomes
+    #   24.44), so pages holding such numbers are reported as mismatches.
+    if list(expected.columns) != list(actual.columns):
+        return False
+    for name in expected.columns:
+        values = expected[name].astype(str)
+        if actual[name].dtype.kind == "i":
+            values = values.str.replace(".", "").replace("-", "0")
+        if not actual[name].astype(str).equals(values):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--pages",
+        default=settings.PAGE_ARCHIVE_FOLDER,
+        help="Page archive folder holding the *.html.gz pages.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Runs per page; the best run is kept.",
+    )
+    args = parser.parse_args()
+
+    paths = sorted(
+        glob.glob(os.path.join(args.pages, "**", "*.html.gz"), recursive=True)
+    )
+    if not paths:
+        parser.error(f"No archived pages found in {args.pages}")
+
+    read_html_time = extract_time = 0.0
+    mismatches = 0
+    for path in paths:
+        with gzip.open(path, "rb") as file:
+            content = file.read()
+        expected = pd.read_html(BytesIO(content))[3]
+        if not _same_table(expected, extract_table(content)):
+            mismatches += 1
+            print(f"[MISMATCH] {path}")
+
+        read_html_time += _best_time(
+            lambda page: pd.read_html(BytesIO(page))[3], content, args.repeat
+        )
+        extract_time += _best_time(extract_table, content, args.repeat)
+
+    count = len(paths)
+    print(f"Pages:         {count} ({mismatches} mismatches)")
+    print(f"pd.read_html:  {read_html_time / count * 1000:8.2f} ms/page")
+    print(f"extract_table: {extract_time / count * 1000:8.2f} ms/page")
+    print(f"Speedup:       {read_html_time / extract_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Provides the database engine, session, and initialization function.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 
 from api.core.config import settings
@@ -19,7 +20,12 @@ def init_db():
     Initializes the database by creating all tables defined in SQLAlchemy models.
     This should be called at application startup.
     """
-    Base.metadata.create_all(bind=engine)
+    try:
+        Base.metadata.create_all(bind=engine)
+    except OperationalError:
+        # Workers start together: another one may have created a table
+        #   between the check and the CREATE. Check again.
+        Base.metadata.create_all(bind=engine)
 
 
 def get_db():
@@ -2,7 +2,7 @@
 Defines the SQLAlchemy ORM models used in the application.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Float, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -23,3 +23,21 @@ class UserDB(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
+
+
+class SyncLeaseDB(Base):
+    """
+    ORM model for the leases electing which process runs a background task
+    (e.g. the periodic sync) when several workers share the database.
+
+    Attributes:
+        name (str): Primary key, name of the leased task.
+        holder (str): Identifier of the process holding the lease.
+        expires_at (float): Unix time the lease expires at unless renewed.
+    """
+
+    __tablename__ = "sync_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False)
+    expires_at = Column(Float, nullable=False)